@@ -0,0 +1,73 @@
+"""유사 경로(협업 필터링) 추천기의 지연 시간과 적중률 벤치마크.
+
+경로를 학습/평가용으로 나눈 뒤, 평가 경로의 마지막 이동을 가리고 나머지 prefix로 추천해
+가려진 직무가 상위 k개 안에 있는지(hit@k)와 질의당 지연 시간을 측정합니다.
+
+사용 예:
+    python benchmarks/bench_neighbors.py
+    python benchmarks/bench_neighbors.py --data my_paths.csv --k 5 --repeat 10
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'job_prediction3'))
+
+from career_neighbors import CareerNeighbors  # noqa: E402
+from path_predictions import extract_paths  # noqa: E402
+
+
+def split_paths(paths, test_ratio, seed):
+    rng = np.random.default_rng(seed)
+    is_test = rng.random(len(paths)) < test_ratio
+    train = [path for path, test in zip(paths, is_test) if not test]
+    test = [path for path, test in zip(paths, is_test) if test]
+    return train, test
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='유사 경로 추천기 지연 시간/적중률 벤치마크')
+    parser.add_argument('--data', default=os.path.join(ROOT, 'job_prediction3', 'path_dataset.csv'))
+    parser.add_argument('--k', type=int, default=3, help='적중 판정에 사용할 추천 수')
+    parser.add_argument('--neighbors', type=int, default=20, help='경로당 이웃 수')
+    parser.add_argument('--test-ratio', type=float, default=0.2)
+    parser.add_argument('--repeat', type=int, default=5, help='지연 시간 측정 반복 횟수')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    paths = extract_paths(pd.read_csv(args.data))
+    train, test = split_paths(paths, args.test_ratio, args.seed)
+
+    start = time.perf_counter()
+    model = CareerNeighbors(train, n_neighbors=args.neighbors)
+    build_time = time.perf_counter() - start
+
+    queries = [(path[:-1], path[-1]) for path in test]
+    hits = covered = 0
+    latencies = []
+    for round_ in range(args.repeat):
+        for prefix, target in queries:
+            start = time.perf_counter()
+            recommendations = model.recommend(prefix, args.k)
+            latencies.append(time.perf_counter() - start)
+            if round_ == 0:
+                covered += bool(recommendations)
+                hits += any(r.title == target for r in recommendations)
+
+    latencies = np.array(latencies) * 1000
+    n = max(len(queries), 1)
+    print(f"학습 경로 {len(train)}개 (고유 {len(model.paths)}개), 평가 질의 {len(queries)}개")
+    print(f"인덱스 생성: {build_time * 1000:.1f} ms")
+    print(f"hit@{args.k}: {hits / n:.3f}  커버리지: {covered / n:.3f}")
+    if latencies.size:
+        print(f"질의 지연 시간 (ms): 평균 {latencies.mean():.3f}  p50 {np.percentile(latencies, 50):.3f}  "
+              f"p95 {np.percentile(latencies, 95):.3f}  p99 {np.percentile(latencies, 99):.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""DatasetStats.sync의 추가/수정 데이터 처리 점검.
+
+데이터 뒤에 행을 추가한 경우와 기존 행을 수정한 뒤 행을 추가한 경우 모두,
+sync()로 맞춘 통계가 새 데이터로 처음부터 센 통계와 같은지 확인합니다.
+
+사용 예:
+    python benchmarks/check_dataset_stats.py
+    python benchmarks/check_dataset_stats.py --data my_paths.csv
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'job_prediction3'))
+
+from path_predictions import STEP_COLUMNS  # noqa: E402
+from path_stats import DatasetStats  # noqa: E402
+
+
+def summary(stats):
+    return (stats.n_rows, stats.title_counts, stats.step_counts, stats.length_counts, stats.transition_counts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='DatasetStats.sync 추가/수정 데이터 점검')
+    parser.add_argument('--data', default=os.path.join(ROOT, 'job_prediction3', 'path_dataset.csv'))
+    parser.add_argument('--append', type=int, default=10, help='추가할 행 수')
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.data)
+    appended = pd.concat([df, df.head(args.append)], ignore_index=True)
+    edited = appended.copy()
+    edited[STEP_COLUMNS[0]] = 'Zed'
+
+    cases = [
+        ('행 추가', appended),
+        ('기존 행 수정 + 행 추가', edited),
+        ('행 삭제', df.head(len(df) // 2)),
+    ]
+    failed = 0
+    for name, new_df in cases:
+        stats = DatasetStats().sync(df).sync(new_df)
+        ok = summary(stats) == summary(DatasetStats(new_df))
+        failed += not ok
+        print(f"{name}: {'OK' if ok else 'FAIL'} (행 {stats.n_rows}개, 최다 직무 {stats.top_titles(1)})")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
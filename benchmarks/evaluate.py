@@ -0,0 +1,147 @@
+"""예측 모델 오프라인 평가 - 마지막 이동을 가린 K-겹 교차 검증.
+
+각 경로의 마지막 직무를 정답으로 두고 나머지 prefix로 예측합니다. 학습 폴드에서의 마이닝/학습은
+프로세스 풀에서 병렬로 실행하고, 예측 결과는 (질의 수 × k) 배열로 모아 한 번에 채점합니다.
+
+평가 대상:
+    apriori   - job_prediction의 연관 규칙 + PredictionTable (min_support, min_confidence 조합별)
+    prefix    - job_prediction3의 PathPredictionTable (전체 경로 → 마지막 직무 기준)
+    neighbors - 두 앱 공통의 CareerNeighbors (유사 경로 기반)
+
+사용 예:
+    python benchmarks/evaluate.py
+    python benchmarks/evaluate.py --folds 10 --k 5 --min-support 0.001 0.01 --min-confidence 0.1 0.3
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'job_prediction'))
+sys.path.insert(0, os.path.join(ROOT, 'job_prediction3'))
+
+from career_neighbors import CareerNeighbors  # noqa: E402
+from path_predictions import PathPredictionTable, extract_paths  # noqa: E402
+from rule_mining import mine_rules  # noqa: E402
+from rule_predictions import PredictionTable  # noqa: E402
+
+
+def fit_model(name, params, train):
+    """학습 경로로 모델을 만들고 (prefix → 제목 리스트) 예측 함수를 반환"""
+    if name == 'apriori':
+        unique_positions = sorted({title for path in train for title in path})
+        rules = mine_rules([list(path) for path in train], unique_positions, **params)
+        table = PredictionTable(rules, len(train))
+        return lambda prefix, k: [p.title for p in table.predict(prefix, k)]
+    if name == 'prefix':
+        table = PathPredictionTable(train)
+        return lambda prefix, k: [p.title for p in table.predict(prefix, k)[0]]
+    if name == 'neighbors':
+        model = CareerNeighbors(train, **params)
+        return lambda prefix, k: [r.title for r in model.recommend(prefix, k)]
+    raise ValueError(f"알 수 없는 모델입니다: {name}")
+
+
+def score_predictions(predicted, targets, k):
+    """예측 제목 리스트들과 정답을 정수 코드 배열로 바꿔 hit@1, hit@k, MRR, 커버리지를 한 번에 계산"""
+    vocab = {title: i for i, title in enumerate(sorted(set(targets) | {t for p in predicted for t in p}))}
+    codes = np.full((len(predicted), k), -1, dtype=np.int64)
+    for i, titles in enumerate(predicted):
+        codes[i, :len(titles)] = [vocab[title] for title in titles[:k]]
+    target_codes = np.array([vocab[title] for title in targets], dtype=np.int64)
+
+    matches = codes == target_codes[:, None]
+    hit = matches.any(axis=1)
+    ranks = matches.argmax(axis=1) + 1
+    return {
+        'hit@1': float(matches[:, 0].mean()),
+        f'hit@{k}': float(hit.mean()),
+        'mrr': float(np.where(hit, 1.0 / ranks, 0.0).mean()),
+        'coverage': float((codes[:, 0] >= 0).mean()),
+    }
+
+
+def run_fold(name, params, train, test, k):
+    """한 폴드: 학습 → 가려진 마지막 이동 예측 → 채점 (프로세스 풀 작업 단위)"""
+    start = time.perf_counter()
+    predict = fit_model(name, params, train)
+    fit_time = time.perf_counter() - start
+
+    prefixes = [path[:-1] for path in test]
+    targets = [path[-1] for path in test]
+    predicted = []
+    latencies = np.empty(len(prefixes))
+    for i, prefix in enumerate(prefixes):
+        start = time.perf_counter()
+        predicted.append(predict(prefix, k))
+        latencies[i] = time.perf_counter() - start
+
+    result = score_predictions(predicted, targets, k)
+    result.update({
+        'fit_s': fit_time,
+        'latency_ms': float(latencies.mean() * 1000) if len(latencies) else 0.0,
+        'latency_p95_ms': float(np.percentile(latencies, 95) * 1000) if len(latencies) else 0.0,
+    })
+    return result
+
+
+def make_folds(paths, n_folds, seed):
+    order = np.random.default_rng(seed).permutation(len(paths))
+    for test_ids in np.array_split(order, n_folds):
+        test_set = set(test_ids.tolist())
+        train = [paths[i] for i in order if i not in test_set]
+        test = [paths[i] for i in test_ids]
+        yield train, test
+
+
+def model_grid(args):
+    yield 'prefix', {}
+    for n_neighbors in args.neighbors:
+        yield 'neighbors', {'n_neighbors': n_neighbors}
+    for min_support, min_confidence in product(args.min_support, args.min_confidence):
+        yield 'apriori', {'min_support': min_support, 'min_confidence': min_confidence}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='직무 예측 모델 오프라인 교차 검증')
+    parser.add_argument('--data', default=os.path.join(ROOT, 'job_prediction3', 'path_dataset.csv'))
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--k', type=int, default=3)
+    parser.add_argument('--min-support', type=float, nargs='+', default=[0.001, 0.01])
+    parser.add_argument('--min-confidence', type=float, nargs='+', default=[0.1, 0.3])
+    parser.add_argument('--neighbors', type=int, nargs='+', default=[20])
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help='결과를 저장할 CSV 경로')
+    args = parser.parse_args(argv)
+
+    paths = extract_paths(pd.read_csv(args.data))
+    folds = list(make_folds(paths, args.folds, args.seed))
+    grid = list(model_grid(args))
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        jobs = [
+            (name, params, pool.submit(run_fold, name, params, train, test, args.k))
+            for name, params in grid
+            for train, test in folds
+        ]
+        rows = [
+            {'model': name, 'params': ', '.join(f'{key}={value}' for key, value in params.items()) or '-', **job.result()}
+            for name, params, job in jobs
+        ]
+
+    report = pd.DataFrame(rows).groupby(['model', 'params'], sort=False).mean().reset_index()
+    print(f"경로 {len(paths)}개, {args.folds}-겹 교차 검증, k={args.k}")
+    print(report.to_string(index=False, float_format=lambda x: f'{x:.4f}'))
+    if args.output:
+        report.to_csv(args.output, index=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+"""Streamlit 앱 동시 세션 부하 테스트.
+
+streamlit.testing의 AppTest로 실제 app.py를 브라우저 없이 실행하며, 여러 가상 세션이 동시에
+직무 선택/예측/슬라이더 조작/파일 업로드 등을 반복합니다.
+
+AppTest는 rerun마다 프로세스 전역 Runtime과 설정을 바꾸므로 한 프로세스 안에서는 rerun을 겹쳐 실행할 수 없습니다.
+그래서 --concurrency개의 작업자 프로세스가 각자 세션을 실행하며, 세션들은 실제로 동시에 실행됩니다.
+작업자 프로세스 하나가 앱 서버 프로세스 하나에 해당하고, 같은 작업자의 세션들은 st.cache_resource와
+모델 레지스트리를 공유합니다. 한 서버 프로세스 안에서 동시에 들어온 rerun 사이의 잠금 경합
+(레지스트리의 키별 생성 잠금 등)은 실제 `streamlit run` 서버로만 잴 수 있어 여기서는 측정하지 않습니다.
+
+동작 하나는 rerun 한 번이며, 처리량(동작/초), 동작별 지연 시간(p50/p95/p99), 세션당 메모리를 보고합니다.
+지연 시간은 순수한 rerun 시간(대기 시간 없음)이고, 세션당 메모리는 작업자마다 워밍업 세션으로
+공유 모델/레지스트리를 먼저 만든 뒤 세션 하나를 실행하는 동안 늘어난 RSS입니다.
+
+사용 예:
+    python benchmarks/load_test.py --app job_prediction --sessions 20 --concurrency 8
+    python benchmarks/load_test.py --app job_prediction3 --sessions 50 --actions 20
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+import warnings
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 작업자 프로세스에서 실행한 세션의 AppTest - 세션 메모리가 해제되지 않도록 남겨 둠
+_sessions = []
+
+
+def current_rss():
+    """(현재 프로세스의 상주 메모리 바이트, 현재 값 여부)
+
+    psutil이나 /proc로 현재 RSS를 읽고, 둘 다 없으면 최대 RSS로 대신합니다 (이때 현재 값 여부는 False).
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss, True
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE'), True
+    except (OSError, ValueError):
+        # ru_maxrss 단위는 macOS가 바이트, 리눅스 등은 KB
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return (max_rss if sys.platform == 'darwin' else max_rss * 1024), False
+
+
+def _by_label(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"위젯을 찾을 수 없습니다: {label}")
+
+
+def _position_boxes(at, prefix):
+    """직무 선택 상자 4개 - 키가 '{prefix}{단계}_{데이터셋 식별자}' 형태이므로 접두어로 찾음"""
+    boxes = {box.key.split('_', 1)[0]: box for box in at.selectbox if box.key and box.key.startswith(prefix)}
+    return [boxes[f'{prefix}{i}'] for i in range(1, 5)]
+
+
+def _select_path(at, rng, selectboxes):
+    """1~4단계 중 앞쪽부터 무작위 길이만큼 직무 코드를 선택하고 나머지는 비움"""
+    length = rng.randint(1, len(selectboxes))
+    for i, box in enumerate(selectboxes):
+        box.set_value(rng.randrange(len(box.options)) if i < length else None)
+
+
+class JobPredictionScenario:
+    """job_prediction (연관 규칙 앱) 사용자 동작"""
+
+    script = os.path.join(ROOT, 'job_prediction', 'app.py')
+    weights = {'select': 4, 'predict': 4, 'slider': 1, 'upload': 1}
+
+    def __init__(self, rng):
+        self.rng = rng
+        with open(os.path.join(ROOT, 'job_prediction', 'path_dataset.csv'), 'rb') as f:
+            self.dataset = f.read()
+
+    def select(self, at):
+        _select_path(at, self.rng, _position_boxes(at, 'pos'))
+
+    def predict(self, at):
+        at.button[0].click()
+
+    def slider(self, at):
+        _by_label(at.slider, '최소 신뢰도').set_value(self.rng.choice([0.1, 0.2, 0.3]))
+
+    def upload(self, at):
+        # 대부분은 같은 파일(레지스트리 공유), 가끔은 행 순서를 바꾼 새 파일
+        content = self.dataset
+        if self.rng.random() < 0.2:
+            header, *rows = content.splitlines(keepends=True)
+            self.rng.shuffle(rows)
+            content = header + b''.join(rows)
+        at.file_uploader[0].set_value(('paths.csv', content, 'text/csv'))
+
+
+class PathPredictionScenario:
+    """job_prediction3 (경로 prefix 앱) 사용자 동작"""
+
+    script = os.path.join(ROOT, 'job_prediction3', 'app.py')
+    weights = {'select': 4, 'predict': 4, 'slider': 1, 'stats': 1}
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def select(self, at):
+        _select_path(at, self.rng, _position_boxes(at, 'position'))
+
+    def predict(self, at):
+        at.radio[0].set_value(self.rng.choice(at.radio[0].options))
+        at.button[0].click()
+
+    def slider(self, at):
+        # 단계 수 슬라이더는 전망 모드에서만 보이므로, 아직 아니면 이번 동작은 모드 전환만 함
+        if at.radio[0].value != '향후 경로 전망':
+            at.radio[0].set_value('향후 경로 전망')
+        else:
+            _by_label(at.slider, '전망할 단계 수').set_value(self.rng.randint(2, 5))
+
+    def stats(self, at):
+        is_open = 'stats_expander' in at.session_state and at.session_state['stats_expander']
+        at.session_state['stats_expander'] = not is_open
+
+
+SCENARIOS = {
+    'job_prediction': JobPredictionScenario,
+    'job_prediction3': PathPredictionScenario,
+}
+
+
+def _quiet():
+    """차트 한글 글꼴 경고와 ScriptRunContext 로그는 측정과 무관하므로 숨김"""
+    warnings.filterwarnings('ignore')
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith('streamlit'):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def _play(app, n_actions, seed, timeout):
+    """가상 세션 하나를 실행 - (AppTest, [(동작, 지연 시간)])을 반환"""
+    rng = random.Random(seed)
+    scenario = SCENARIOS[app](rng)
+    names = list(scenario.weights)
+    weights = [scenario.weights[name] for name in names]
+
+    timings = []
+    start = time.perf_counter()
+    at = AppTest.from_file(scenario.script, default_timeout=timeout).run()
+    timings.append(('open', time.perf_counter() - start))
+
+    for _ in range(n_actions):
+        action = rng.choices(names, weights)[0]
+        getattr(scenario, action)(at)
+        start = time.perf_counter()
+        at.run()
+        timings.append((action, time.perf_counter() - start))
+        if at.exception:
+            raise RuntimeError(f"{action} 동작 중 앱 예외: {at.exception[0].value}")
+    return at, timings
+
+
+def _init_worker(app, n_warmup, n_actions, seed, timeout):
+    """작업자 프로세스 초기화 - 워밍업 세션으로 이 프로세스의 공유 캐시/모델을 먼저 만듦"""
+    _quiet()
+    for i in range(n_warmup):
+        _sessions.append(_play(app, n_actions, seed - 1 - i, timeout)[0])
+
+
+def run_session(app, n_actions, seed, timeout):
+    """작업자 프로세스에서 세션 하나를 실행 - (동작별 지연 시간, RSS 증가분, 현재 RSS 여부)를 반환"""
+    rss_before, _ = current_rss()
+    at, timings = _play(app, n_actions, seed, timeout)
+    rss_after, rss_exact = current_rss()
+    _sessions.append(at)
+    return timings, rss_after - rss_before, rss_exact
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Streamlit 앱 동시 세션 부하 테스트')
+    parser.add_argument('--app', choices=sorted(SCENARIOS), default='job_prediction')
+    parser.add_argument('--sessions', type=int, default=20, help='전체 가상 세션 수')
+    parser.add_argument('--concurrency', type=int, default=8, help='동시에 세션을 실행할 작업자 프로세스 수')
+    parser.add_argument('--actions', type=int, default=10, help='세션당 동작 수')
+    parser.add_argument('--timeout', type=float, default=120, help='rerun 한 번의 제한 시간(초)')
+    parser.add_argument('--warmup', type=int, default=1, help='작업자마다 측정 전에 실행할 워밍업 세션 수')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    initargs = (args.app, args.warmup, args.actions, args.seed, args.timeout)
+    # fork는 부모 프로세스의 streamlit 스레드 상태를 복제하므로 작업자는 새 인터프리터로 시작
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=args.concurrency, mp_context=context,
+                             initializer=_init_worker, initargs=initargs) as pool:
+        # 모든 작업자의 워밍업이 끝난 뒤부터 시간을 잼
+        list(pool.map(time.sleep, [0.1] * args.concurrency))
+        start = time.perf_counter()
+        jobs = [pool.submit(run_session, args.app, args.actions, args.seed + i, args.timeout)
+                for i in range(args.sessions)]
+        results = [job.result() for job in jobs]
+        elapsed = time.perf_counter() - start
+
+    latencies = defaultdict(list)
+    for timings, _, _ in results:
+        for action, seconds in timings:
+            latencies[action].append(seconds * 1000)
+    n_actions = sum(len(timings) for timings, _, _ in results)
+    rss_growth = np.array([growth for _, growth, _ in results], dtype=np.float64)
+    rss_exact = all(exact for _, _, exact in results)
+
+    print(f"앱 {args.app}: 세션 {args.sessions}개 (작업자 프로세스 {args.concurrency}개), 세션당 동작 {args.actions}개")
+    print(f"전체 {n_actions}회 rerun, {elapsed:.1f}초, 처리량 {n_actions / elapsed:.2f} 동작/초")
+    rss_label = '워밍업 이후 RSS 증가분' if rss_exact else '워밍업 이후 최대 RSS 증가분 - psutil이 없어 근사치'
+    print(f"세션당 메모리 ({rss_label}): 평균 {rss_growth.mean() / 2**20:.2f} MB, "
+          f"최대 {rss_growth.max() / 2**20:.2f} MB")
+    print(f"{'동작':<10}{'횟수':>6}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'최대(ms)':>10}")
+    for action in ['open'] + list(SCENARIOS[args.app].weights):
+        values = np.array(latencies.get(action, []))
+        if values.size == 0:
+            continue
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        print(f"{action:<10}{values.size:>6}{p50:>10.1f}{p95:>10.1f}{p99:>10.1f}{values.max():>10.1f}")
+
+
+if __name__ == '__main__':
+    # AppTest는 실행 중 sys.modules['__main__']을 앱 스크립트로 바꾸므로,
+    # 작업자가 run_session을 찾을 수 있도록 모듈 이름(load_test)으로 다시 불러와 실행
+    import load_test
+    load_test.main()
@@ -1,10 +1,22 @@
+import math
+import os
+from collections import namedtuple
+
 import pandas as pd
-from mlxtend.frequent_patterns import apriori, association_rules
 import streamlit as st
 import plotly.express as px
 import networkx as nx
 import matplotlib.pyplot as plt
 
+from rule_mining import load_career_paths, mine_rules
+from rule_set import RuleSet
+from rule_query import RuleIndex, METRIC_COLUMNS
+from rule_export import EXPORT_FORMATS, export_rules_bytes
+from rule_predictions import PredictionTable
+from career_neighbors import CareerNeighbors
+from model_registry import DEFAULT_MAX_BYTES, ModelRegistry, content_key
+from title_picker import TitleSearch, title_selectbox
+
 # Streamlit 페이지 설정
 st.set_page_config(
     page_title="🎯 직무 경로 예측기",
@@ -19,128 +31,74 @@ st.sidebar.markdown("""
     **직무 경로 예측을 위한 설정을 조정하세요.**
 """)
 
-# 데이터 로드 및 전처리 함수
-@st.cache_data
-def load_and_prepare_data(filepath=None):
+# 데이터셋 하나에서 만든 모델과 (데이터셋, 지지도, 신뢰도) 조합 하나에서 마이닝한 모델
+DatasetModel = namedtuple('DatasetModel', ['career_paths', 'unique_positions', 'title_search'])
+RuleModel = namedtuple('RuleModel', ['rules', 'rule_index', 'prediction_table', 'query_search'])
+
+# 서버 전체에서 공유하는 모델 레지스트리 - 메모리 예산은 MODEL_REGISTRY_MAX_MB 환경 변수로 조정
+@st.cache_resource
+def get_model_registry():
+    max_mb = os.environ.get('MODEL_REGISTRY_MAX_MB')
+    return ModelRegistry(int(max_mb) * 1024 * 1024 if max_mb else DEFAULT_MAX_BYTES)
+
+def build_dataset_model(source=None):
+    career_paths, unique_positions = load_career_paths(source)
+    return DatasetModel(career_paths, unique_positions, TitleSearch(unique_positions))
+
+def build_rule_model(dataset, min_support, min_confidence):
+    rules = mine_rules(dataset.career_paths, dataset.unique_positions, min_support, min_confidence)
+    rule_index = RuleIndex(rules)
+    # 규칙 필터의 직무 선택은 규칙에 등장하는 직무로 한정
+    query_search = TitleSearch(dataset.unique_positions, rule_index.codes)
+    return RuleModel(rules, rule_index, PredictionTable(rules, len(dataset.career_paths)), query_search)
+
+# 데이터 로드 및 전처리 함수 - 같은 내용의 파일은 모든 사용자가 하나의 모델을 공유
+def load_and_prepare_data(registry, data_key, uploaded_file=None):
     try:
-        if filepath is None:
-            # 내장된 데이터셋 사용
-            df = pd.read_csv('job_prediction/path_dataset.csv', encoding='utf-8')
-        else:
-            # 사용자가 업로드한 파일 사용
-            for encoding in ['utf-8', 'cp949', 'euc-kr']:
-                try:
-                    df = pd.read_csv(filepath, encoding=encoding, sep=None, engine='python')
-                    if not df.empty:
-                        break
-                except UnicodeDecodeError:
-                    continue
-                except Exception as e:
-                    continue
-        
-        if df.empty:
-            st.error("데이터를 읽을 수 없습니다. CSV 파일 형식을 확인해주세요.")
-            return [], []
-            
-        # 직무 경로를 하나의 문자열로 결합
-        df['career_path'] = df.iloc[:, 1:].apply(
-            lambda x: ','.join([str(pos) for pos in x if pd.notna(pos) and str(pos).strip()]), axis=1
-        )
-        
-        # 직무 경로를 리스트로 변환
-        career_paths = df['career_path'].str.split(',').tolist()
-        
-        # 유니크한 직무 목록 생성
-        unique_positions = sorted(set([pos.strip() for path in career_paths for pos in path if pos.strip()]))
-        
-        return career_paths, unique_positions
-        
+        return registry.get_or_build(('data', data_key), lambda: build_dataset_model(uploaded_file))
+    except ValueError as e:
+        st.error(str(e))
     except Exception as e:
         st.error(f"데이터를 로드하는 중 오류가 발생했습니다: {str(e)}")
-        return [], []
+    return None
 
 # 연관성 규칙 생성 함수
-@st.cache_data
-def generate_rules(career_paths, unique_positions, min_support=0.001, min_confidence=0.1):
+def generate_rules(registry, data_key, dataset, min_support=0.001, min_confidence=0.1):
     try:
-        # 트랜잭션 데이터프레임 생성
-        transactions = pd.DataFrame([
-            {pos: (pos in path) for pos in unique_positions}
-            for path in career_paths if path
-        ])
-        
-        # Apriori 알고리즘 적용 - max_len 파라미터 추가
-        frequent_itemsets = apriori(
-            transactions,
-            min_support=min_support,
-            use_colnames=True,
-            max_len=3  # 최대 아이템 조합 개수 설정
-        )
-        
-        if frequent_itemsets.empty:
-            return pd.DataFrame(columns=['antecedents', 'consequents', 'support', 'confidence', 'lift'])
-        
-        # 연관성 규칙 생성 - metric과 min_threshold 조정
-        rules = association_rules(
-            frequent_itemsets,
-            metric="confidence",
-            min_threshold=min_confidence,
-            support_only=False  # 다양한 메트릭 계산
+        return registry.get_or_build(
+            ('rules', data_key, min_support, min_confidence),
+            lambda: build_rule_model(dataset, min_support, min_confidence),
         )
-        
-        if not rules.empty:
-            # 규칙 필터링 및 정렬
-            rules = rules[
-                (rules['lift'] > 1.0) &  # 양의 상관관계만 선택
-                (rules['antecedents'].apply(len) <= 2)  # 선행항목 개수 제한
-            ]
-            rules = rules.sort_values(['confidence', 'lift', 'support'], ascending=[False, False, False])
-        
-        return rules
-        
     except Exception as e:
         st.error(f"연관 규칙 생성 중 오류가 발생했습니다: {str(e)}")
-        return pd.DataFrame(columns=['antecedents', 'consequents', 'support', 'confidence', 'lift'])
+        rules = RuleSet.empty_set(dataset.unique_positions)
+        return RuleModel(rules, None, PredictionTable(rules, len(dataset.career_paths)), None)
 
-# 다음 직무 예측 함수
-def predict_next_position(current_positions, rules):
+# 유사 경로 추천기 - 규칙이 없을 때(대체 예측)에만 처음 만들고 데이터셋별로 레지스트리에서 공유
+def get_career_neighbors(registry, data_key, dataset):
+    return registry.get_or_build(('neighbors', data_key), lambda: CareerNeighbors(dataset.career_paths))
+
+# 다음 직무 예측 함수 - 선택한 직무 코드로 조회하고 상위 k개만 표시용 Prediction으로 변환
+def predict_next_position(current_codes, prediction_table, k=3):
     try:
-        if rules.empty:
-            return "예측할 수 없습니다."
-        
-        # 현재 직무와 관련된 규칙 찾기
-        relevant_rules = rules[rules['antecedents'].apply(
-            lambda x: any(pos in x for pos in current_positions)
-        )]
-        
-        if relevant_rules.empty:
-            return "예측할 수 없습니다."
-        
-        # 신뢰도와 향상도로 정렬
-        relevant_rules = relevant_rules.sort_values(['confidence', 'lift'], ascending=[False, False])
-        
-        # 현재 직무에 없는 새로운 직무 찾기
-        for _, rule in relevant_rules.iterrows():
-            consequents = list(rule['consequents'])  # frozenset을 리스트로 변환
-            for consequent in consequents:
-                if consequent not in current_positions:
-                    return f"{consequent} (신뢰도: {rule['confidence']:.2%}, 향상도: {rule['lift']:.2f})"
-        
-        return "예측할 수 없습니다."
-        
+        return prediction_table.to_predictions(prediction_table.predict_codes(current_codes, k))
     except Exception as e:
         st.error(f"예측 중 오류가 발생했습니다: {str(e)}")
-        return "예측할 수 없습니다."
+        return []
 
 # 연관 규칙 시각화 함수 - 산점도
 def plot_rules_scatter(rules):
     if rules.empty:
         st.warning("연관 규칙이 없습니다.")
         return
-    # Create a copy and convert 'antecedents' and 'consequents' to strings
-    rules_plot = rules.copy()
-    rules_plot['antecedents_str'] = rules_plot['antecedents'].apply(lambda x: ', '.join(x))
-    rules_plot['consequents_str'] = rules_plot['consequents'].apply(lambda x: ', '.join(x))
+    # 지표 배열과 표시용 직무명 문자열로 플롯용 DataFrame 구성
+    rules_plot = pd.DataFrame({
+        'support': rules.metrics['support'],
+        'confidence': rules.metrics['confidence'],
+        'lift': rules.metrics['lift'],
+        'antecedents_str': rules.itemset_strings('antecedents'),
+        'consequents_str': rules.itemset_strings('consequents'),
+    })
     fig = px.scatter(
         rules_plot,
         x='support',
@@ -161,10 +119,12 @@ def plot_rules_network(rules):
         return plt.figure()
     
     G = nx.Graph()
-    for _, row in rules.iterrows():
-        for antecedent in row['antecedents']:
-            for consequent in row['consequents']:
-                G.add_edge(antecedent, consequent, weight=row['lift'])
+    titles = rules.titles
+    edges = zip(rules.itemset_codes('antecedents'), rules.itemset_codes('consequents'), rules.metrics['lift'].tolist())
+    for antecedents, consequents, lift in edges:
+        for antecedent in antecedents:
+            for consequent in consequents:
+                G.add_edge(titles[antecedent], titles[consequent], weight=lift)
     
     pos = nx.spring_layout(G, k=0.5)
     edge_weights = [G[u][v]['weight'] for u, v in G.edges()]
@@ -229,93 +189,147 @@ st.markdown("""
 # 파일 업로드 (선택사항)
 uploaded_file = st.sidebar.file_uploader("사용자 데이터 파일 업로드 (CSV, 선택사항)", type="csv")
 
-# 데이터 로드
-career_paths, unique_positions = load_and_prepare_data(uploaded_file)
+# 데이터 로드 - 업로드 파일은 내용 해시로 식별
+registry = get_model_registry()
+data_key = 'builtin' if uploaded_file is None else content_key(uploaded_file.getvalue())
+dataset = load_and_prepare_data(registry, data_key, uploaded_file)
 
-if not career_paths:
+if dataset is None or not dataset.career_paths:
     st.stop()
 
+career_paths, unique_positions = dataset.career_paths, dataset.unique_positions
+title_search = dataset.title_search
+
 # 사이드바 설정
 min_support = st.sidebar.slider('최소 지지도', min_value=0.0, max_value=0.1, value=0.001, step=0.001)
 min_confidence = st.sidebar.slider('최소 신뢰도', min_value=0.0, max_value=1.0, value=0.1, step=0.05)
 
+top_k = st.sidebar.slider('예측 후보 수', min_value=1, max_value=10, value=3)
+
 # 연관 규칙 생성
-rules = generate_rules(career_paths, unique_positions, min_support, min_confidence)
+rule_model = generate_rules(registry, data_key, dataset, min_support, min_confidence)
+rules, prediction_table = rule_model.rules, rule_model.prediction_table
 
 st.sidebar.markdown("### 🔍 규칙 필터링")
 st.sidebar.markdown(f"총 발견된 규칙 수: **{len(rules)}**")
 
-# 직무 선택 UI를 컬럼으로 나누기
+rule_ids = None
+if not rules.empty:
+    rule_index = rule_model.rule_index
+
+    with st.sidebar:
+        query_code = title_selectbox('직무명', rule_model.query_search, key=f'query_title_{data_key}', placeholder='전체')
+    query_side = st.sidebar.radio(
+        '직무 위치',
+        options=['any', 'antecedents', 'consequents'],
+        format_func={'any': '선행/후행 모두', 'antecedents': '선행 항목', 'consequents': '후행 항목'}.get,
+        horizontal=True,
+        key='query_side',
+    )
+
+    # 지표 범위 - 슬라이더가 최대값이면 상한을 두지 않음 (conviction의 무한대 포함)
+    range_filters = {}
+    for metric, label in [('lift', '향상도 범위'), ('leverage', '레버리지 범위'), ('conviction', '확신도 범위')]:
+        low, high = rule_index.metric_bounds(metric)
+        if low == high:
+            continue
+        # 기본 간격(0.01)은 레버리지처럼 범위가 좁은 지표에 너무 크므로 범위의 1/100 간격과 그에 맞는 자릿수 사용
+        step = (high - low) / 100
+        decimals = max(int(-math.floor(math.log10(step))) + 1, 2)
+        selected_low, selected_high = st.sidebar.slider(
+            label, min_value=low, max_value=high, value=(low, high), step=step, format=f'%.{decimals}f',
+            key=f'query_{metric}',
+        )
+        range_filters[metric] = (selected_low, None if selected_high >= high else selected_high)
+
+    max_len = int(rule_index.antecedent_len.max())
+    antecedent_len = (1, max_len)
+    if max_len > 1:
+        antecedent_len = st.sidebar.slider('선행 항목 개수', min_value=1, max_value=max_len, value=(1, max_len), key='query_len')
+
+    sort_by = st.sidebar.selectbox('정렬 기준', options=METRIC_COLUMNS, index=METRIC_COLUMNS.index('confidence'), key='query_sort')
+    ascending = st.sidebar.checkbox('오름차순 정렬', value=False, key='query_ascending')
+    page_size = st.sidebar.selectbox('페이지당 규칙 수', options=[20, 50, 100], index=1, key='query_page_size')
+
+    rule_ids = rule_index.filter(
+        code=query_code,
+        side=query_side,
+        antecedent_len=antecedent_len,
+        **range_filters,
+    )
+
+# 모델 레지스트리 상태
+registry_stats = registry.stats()
+st.sidebar.markdown("### 🗄️ 모델 캐시")
+st.sidebar.caption(
+    f"모델 {registry_stats['entries']}개 · "
+    f"{registry_stats['bytes'] / 2**20:.1f} / {registry_stats['max_bytes'] / 2**20:.0f} MB · "
+    f"적중률 {registry_stats['hit_rate']:.0%} · 제거 {registry_stats['evictions']}회"
+)
+
+# 직무 선택 UI를 컬럼으로 나누기 - 직무 코드는 데이터셋마다 뜻이 다르므로 위젯 키에 데이터셋 키를 포함
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     st.markdown("### 1단계")
-    pos1 = st.selectbox(
-        '첫 번째 직무',
-        options=['선택하세요'] + unique_positions,
-        key='pos1'
-    )
+    pos1 = title_selectbox('첫 번째 직무', title_search, key=f'pos1_{data_key}')
 
 with col2:
     st.markdown("### 2단계")
-    pos2 = st.selectbox(
-        '두 번째 직무',
-        options=['선택하세요'] + unique_positions,
-        key='pos2'
-    )
+    pos2 = title_selectbox('두 번째 직무', title_search, key=f'pos2_{data_key}')
 
 with col3:
     st.markdown("### 3단계")
-    pos3 = st.selectbox(
-        '세 번째 직무',
-        options=['선택하세요'] + unique_positions,
-        key='pos3'
-    )
+    pos3 = title_selectbox('세 번째 직무', title_search, key=f'pos3_{data_key}')
 
 with col4:
     st.markdown("### 4단계")
-    pos4 = st.selectbox(
-        '네 번째 직무',
-        options=['선택하세요'] + unique_positions,
-        key='pos4'
-    )
+    pos4 = title_selectbox('네 번째 직무', title_search, key=f'pos4_{data_key}')
 
-# 선택된 직무 수집
-selected_positions = [pos for pos in [pos1, pos2, pos3, pos4] if pos != '선택하세요']
+# 선택된 직무 코드 수집 - 직무명은 표시할 때만 변환
+selected_codes = [code for code in [pos1, pos2, pos3, pos4] if code is not None]
+selected_positions = [unique_positions[code] for code in selected_codes]
 
 # 예측 버튼
 if st.button('🔮 다음 직무 예측하기', type='primary'):
     if selected_positions:
-        next_position = predict_next_position(selected_positions, rules)
+        predictions = predict_next_position(selected_codes, prediction_table, top_k)
         
         st.markdown("---")
         st.markdown("### 🎯 **예측 결과**")
-        if next_position != "예측할 수 없습니다.":
-            st.success(f"**다음 예상 직무:** {next_position}")
+        if predictions:
+            best = predictions[0]
+            st.success(f"**다음 예상 직무:** {best.title} (신뢰도: {best.confidence:.2%}, 향상도: {best.lift:.2f})")
             
-            relevant_rules = rules[rules['antecedents'].apply(
-                lambda x: all(pos in x for pos in selected_positions)
-            )]
-            relevant_rules = relevant_rules[relevant_rules['consequents'].apply(
-                lambda x: next_position in x
-            )]
+            st.markdown("#### **연관 규칙 세부 정보**")
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                st.metric(label="**신뢰도**", value=f"{best.confidence:.2%}")
+            with col_b:
+                st.metric(label="**지지도**", value=f"{best.support:.2%}")
+            with col_c:
+                st.metric(label="**향상도**", value=f"{best.lift:.2f}")
             
-            if not relevant_rules.empty:
-                confidence = relevant_rules.iloc[0]['confidence']
-                support = relevant_rules.iloc[0]['support']
-                lift = relevant_rules.iloc[0]['lift']
-                
-                st.markdown("#### **연관 규칙 세부 정보**")
-                col_a, col_b, col_c = st.columns(3)
-                with col_a:
-                    st.metric(label="**신뢰도**", value=f"{confidence:.2%}")
-                with col_b:
-                    st.metric(label="**지지도**", value=f"{support:.2%}")
-                with col_c:
-                    st.metric(label="**향상도**", value=f"{lift:.2f}")
+            if len(predictions) > 1:
+                st.markdown(f"#### **상위 {len(predictions)}개 예측 후보**")
+                st.dataframe(
+                    pd.DataFrame(predictions).rename(columns={
+                        'title': '직무', 'confidence': '신뢰도', 'lift': '향상도', 'support': '지지도', 'count': '건수'
+                    }),
+                    width='stretch',
+                    hide_index=True,
+                )
         else:
-            st.error("선택하신 직무 경로에 대한 예측이 불가능합니다.")
-            st.info("다른 직무 조합을 선택해보세요.")
+            neighbors = get_career_neighbors(registry, data_key, dataset)
+            recommendations = neighbors.recommend(selected_positions, top_k)
+            if recommendations:
+                st.info("선택하신 직무 조합에 맞는 연관 규칙은 없지만, 가장 비슷한 직무 경로들을 바탕으로 추천합니다.")
+                st.success(f"**다음 예상 직무:** {recommendations[0].title} (유사 경로 점수: {recommendations[0].score:.2%})")
+                for r in recommendations:
+                    st.write(f"**{r.title}**: {r.score:.1%} (유사 경로 {r.neighbors}건)")
+            else:
+                st.error("선택하신 직무 경로에 대한 예측이 불가능합니다.")
+                st.info("다른 직무 조합을 선택해보세요.")
     else:
         st.warning('🔔 최소 한 개 이상의 직무를 선택해주세요.')
 
@@ -326,6 +340,20 @@ if selected_positions:
     career_path = " → ".join(selected_positions)
     st.markdown(f"**{career_path}**")
 
+# 규칙 탐색 결과
+if rule_ids is not None:
+    st.markdown("---")
+    st.markdown("### 🔍 **규칙 탐색**")
+    page_count = max((len(rule_ids) - 1) // page_size + 1, 1)
+    page = st.number_input('페이지', min_value=1, max_value=page_count, value=1, step=1, key='query_page')
+    page_rules = rule_index.page(rule_ids, sort_by, ascending, int(page), page_size)
+    st.caption(f"조건에 맞는 규칙 {len(rule_ids)}개 · {page} / {page_count} 페이지")
+    st.dataframe(
+        page_rules[['antecedents', 'consequents'] + [col for col in METRIC_COLUMNS if col in page_rules.columns]],
+        width='stretch',
+        hide_index=True,
+    )
+
 # 연관 규칙 시각화
 if not rules.empty:
     st.markdown("---")
@@ -344,17 +372,20 @@ if not rules.empty:
 else:
     st.info("설정된 최소 지지도 및 신뢰도 기준에 맞는 연관 규칙이 없습니다.")
 
-# 연관 규칙 다운로드 버튼 추가
+# 연관 규칙 다운로드 버튼 추가 - 파일 내용은 버튼을 눌렀을 때만 청크 단위로 생성
 if not rules.empty:
-    # Convert 'antecedents' and 'consequents' to strings for CSV
-    rules_download = rules.copy()
-    rules_download['antecedents'] = rules_download['antecedents'].apply(lambda x: ', '.join(x))
-    rules_download['consequents'] = rules_download['consequents'].apply(lambda x: ', '.join(x))
-    
     st.markdown("---")
+    export_format = st.radio(
+        '다운로드 형식',
+        options=list(EXPORT_FORMATS),
+        format_func=str.upper,
+        horizontal=True,
+        key='export_format',
+    )
+    file_name, mime = EXPORT_FORMATS[export_format]
     st.download_button(
         label="📥 연관 규칙 다운로드",
-        data=rules_download.to_csv(index=False),
-        file_name='association_rules.csv',
-        mime='text/csv',
+        data=lambda: export_rules_bytes(rules, export_format),
+        file_name=file_name,
+        mime=mime,
     )
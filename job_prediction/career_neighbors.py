@@ -0,0 +1,162 @@
+"""희소 직원 × 직무 행렬 기반 최근접 이웃(협업 필터링) 추천.
+
+규칙이나 prefix가 일치하지 않을 때의 대체 예측에 사용합니다. 같은 경로는 한 행으로 묶고,
+직무는 경로 내 위치에 따라 가중치를 주어 (나중 직무일수록 큼) L2 정규화한 뒤
+코사인 유사도를 희소 행렬 곱으로 한 번에 계산합니다. 관측된 경로의 이웃은 미리 계산해 두며,
+유사도 행렬은 희소 형태 그대로 청크 단위로 만들어 청크당 메모리가 CHUNK_BUDGET_BYTES를 넘지 않게 합니다.
+
+job_prediction/career_neighbors.py와 job_prediction3/career_neighbors.py는 같은 파일입니다.
+"""
+from collections import Counter, namedtuple
+
+import numpy as np
+from scipy import sparse
+
+# 추천 결과 한 건 - score는 이웃 유사도 합의 비율, neighbors는 근거가 된 이웃 경로(직원) 수
+Recommendation = namedtuple('Recommendation', ['title', 'score', 'neighbors'])
+
+# 미리 계산해 두는 경로당 이웃 수
+DEFAULT_NEIGHBORS = 20
+
+# 이웃 인덱스를 계산할 때 청크 하나의 (희소) 유사도 행렬과 임시 배열에 쓸 메모리 상한
+CHUNK_BUDGET_BYTES = 64 * 2**20
+
+# 유사도 행렬의 0이 아닌 값 하나당 대략적인 바이트 수 (값 + 열 번호 + 정렬용 임시 배열)
+BYTES_PER_PAIR = 48
+
+
+def _clean(path):
+    return tuple(str(title).strip() for title in path if str(title).strip())
+
+
+class CareerNeighbors:
+    """경로 간 코사인 유사도로 다음 직무를 추천"""
+
+    def __init__(self, career_paths, n_neighbors=DEFAULT_NEIGHBORS):
+        # 같은 경로는 한 행으로 묶고 인원수를 가중치로 사용
+        counts = Counter(path for path in map(_clean, career_paths) if path)
+        self.paths = list(counts)
+        self.weights = np.array([counts[path] for path in self.paths], dtype=np.float64)
+        self.path_ids = {path: i for i, path in enumerate(self.paths)}
+        self.titles = sorted({title for path in self.paths for title in path})
+        self.title_ids = {title: i for i, title in enumerate(self.titles)}
+        self.n_neighbors = min(n_neighbors, len(self.paths))
+
+        rows, cols, values = [], [], []
+        for i, path in enumerate(self.paths):
+            for step, title in enumerate(path):
+                rows.append(i)
+                cols.append(self.title_ids[title])
+                values.append((step + 1) / len(path))
+        matrix = sparse.csr_matrix((values, (rows, cols)), shape=(len(self.paths), len(self.titles)))
+        self.matrix = self._normalize(matrix)
+
+        self.neighbor_ids, self.neighbor_sims = self._build_neighbor_index()
+
+    @staticmethod
+    def _normalize(matrix):
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.diags(1.0 / norms) @ matrix
+
+    def _top_neighbors(self, sims):
+        """희소 유사도 행렬(CSR)에서 행마다 상위 이웃 번호와 유사도를 선택
+
+        유사도가 0보다 큰 이웃이 n개보다 적은 행은 나머지를 번호 -1, 유사도 0으로 채웁니다.
+        """
+        n_rows = sims.shape[0]
+        ids = np.full((n_rows, self.n_neighbors), -1, dtype=np.int64)
+        top_sims = np.zeros((n_rows, self.n_neighbors))
+
+        # 행 → 유사도 내림차순 → 경로 번호 순으로 정렬한 뒤 행 안에서의 순위가 n 미만인 값만 남김
+        # (경로 번호순으로 맞춘 뒤 유사도, 행 순서로 안정 정렬 - 다중 키 lexsort보다 빠름)
+        sims.sort_indices()
+        row_of = np.repeat(np.arange(n_rows), np.diff(sims.indptr))
+        order = np.argsort(-sims.data, kind='stable')
+        order = order[np.argsort(row_of[order], kind='stable')]
+        rank = np.arange(sims.nnz) - sims.indptr[row_of]
+        selected = rank < self.n_neighbors
+        keep = order[selected]
+        ids[row_of[selected], rank[selected]] = sims.indices[keep]
+        top_sims[row_of[selected], rank[selected]] = sims.data[keep]
+        return ids, top_sims
+
+    def _chunk_bounds(self):
+        """청크별 유사도 행렬의 0이 아닌 값 개수가 메모리 상한을 넘지 않도록 나눈 행 경계"""
+        n_rows = len(self.paths)
+        # 행과 유사도가 0이 아닌 경로 수의 상한 = 그 행의 직무들이 등장하는 경로 수의 합
+        title_freq = np.bincount(self.matrix.indices, minlength=len(self.titles))
+        row_of = np.repeat(np.arange(n_rows), np.diff(self.matrix.indptr))
+        row_pairs = np.bincount(row_of, weights=title_freq[self.matrix.indices], minlength=n_rows)
+        cumulative = np.cumsum(row_pairs)
+        max_pairs = max(CHUNK_BUDGET_BYTES // BYTES_PER_PAIR, 1)
+
+        bounds = [0]
+        while bounds[-1] < n_rows:
+            start = bounds[-1]
+            base = cumulative[start - 1] if start else 0.0
+            stop = int(np.searchsorted(cumulative, base + max_pairs, side='right'))
+            bounds.append(max(stop, start + 1))
+        return bounds
+
+    def _build_neighbor_index(self):
+        """관측된 모든 경로의 이웃을 청크 단위 희소 행렬 곱으로 미리 계산"""
+        if self.n_neighbors == 0:
+            return np.empty((len(self.paths), 0), dtype=np.int64), np.empty((len(self.paths), 0))
+        ids, sims = [], []
+        transposed = self.matrix.T.tocsr()
+        bounds = self._chunk_bounds()
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            chunk = (self.matrix[start:stop] @ transposed).tocsr()
+            # 자기 자신(유사도 1)은 추천에 쓸모가 없으므로 이웃 후보에서 제외
+            chunk.setdiag(0, k=start)
+            chunk.eliminate_zeros()
+            chunk_ids, chunk_sims = self._top_neighbors(chunk)
+            ids.append(chunk_ids)
+            sims.append(chunk_sims)
+        if not ids:
+            return np.empty((0, 0), dtype=np.int64), np.empty((0, 0))
+        return np.vstack(ids), np.vstack(sims)
+
+    def _query_vector(self, path):
+        cols = [self.title_ids[title] for title in path if title in self.title_ids]
+        values = [(step + 1) / len(path) for step, title in enumerate(path) if title in self.title_ids]
+        vector = sparse.csr_matrix((values, ([0] * len(cols), cols)), shape=(1, len(self.titles)))
+        return self._normalize(vector)
+
+    def neighbors(self, current_path):
+        """(이웃 경로 번호 배열, 유사도 배열) - 관측된 경로면 미리 계산된 인덱스를 사용"""
+        path = _clean(current_path)
+        path_id = self.path_ids.get(path)
+        if path_id is not None:
+            ids, sims = self.neighbor_ids[path_id], self.neighbor_sims[path_id]
+        else:
+            query = self._query_vector(path)
+            if query.nnz == 0 or self.n_neighbors == 0:
+                return np.empty(0, dtype=np.int64), np.empty(0)
+            ids, sims = self._top_neighbors((query @ self.matrix.T).tocsr())
+            ids, sims = ids[0], sims[0]
+        found = ids >= 0
+        return ids[found], sims[found]
+
+    def recommend(self, current_path, k=3):
+        """이웃 경로에서 현재 경로와 공유하는 마지막 직무 이후에 나온 직무들을 유사도로 가중 집계"""
+        path = _clean(current_path)
+        current = set(path)
+        scores = Counter()
+        supporters = Counter()
+
+        for neighbor_id, sim in zip(*self.neighbors(path)):
+            if sim <= 0:
+                continue
+            neighbor = self.paths[neighbor_id]
+            shared = [i for i, title in enumerate(neighbor) if title in current]
+            if not shared:
+                continue
+            for title in set(neighbor[shared[-1] + 1:]) - current:
+                scores[title] += sim * self.weights[neighbor_id]
+                supporters[title] += int(self.weights[neighbor_id])
+
+        total = sum(scores.values())
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [Recommendation(title, float(score / total), supporters[title]) for title, score in ranked]
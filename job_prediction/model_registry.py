@@ -0,0 +1,125 @@
+"""업로드 데이터셋별 마이닝 결과를 공유하는 LRU 모델 레지스트리.
+
+업로드된 파일은 내용 해시로 식별하므로, 서로 다른 사용자가 같은 파일을 올려도 로드/마이닝은 한 번만
+수행됩니다. 저장된 모델의 추정 메모리 합계가 예산을 넘으면 가장 오래 사용하지 않은 모델부터 제거합니다.
+"""
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# 기본 메모리 예산 (바이트)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def content_key(data):
+    """업로드된 파일 바이트의 내용 해시"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def estimate_size(obj, _seen=None):
+    """객체가 참조하는 메모리의 대략적인 바이트 수 (DataFrame/ndarray/컨테이너/일반 객체)"""
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, pd.DataFrame):
+        size = int(obj.memory_usage(index=True, deep=True).sum())
+        # frozenset 같은 object 열의 원소는 memory_usage에 포함되지 않음
+        for col in obj.columns[obj.dtypes == object]:
+            size += sum(estimate_size(value, seen) for value in obj[col])
+        return size
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return sys.getsizeof(obj)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen) for item in obj)
+    elif hasattr(obj, '__dict__'):
+        size += estimate_size(vars(obj), seen)
+    return size
+
+
+class ModelRegistry:
+    """키 → 모델 LRU 캐시 (메모리 예산 기반 제거, 스레드 안전)"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (모델, 추정 크기)
+        self._lock = threading.Lock()
+        self._building = {}  # key -> 같은 키를 동시에 만들지 않도록 하는 잠금
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get_or_build(self, key, build):
+        """key의 모델을 반환 - 없으면 build()로 만들어 등록 (build가 예외를 내면 등록하지 않음)"""
+        model = self.get(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            key_lock = self._building.setdefault(key, threading.Lock())
+        with key_lock:
+            # 기다리는 동안 다른 세션이 먼저 만들었을 수 있음
+            model = self.get(key)
+            if model is not None:
+                return model
+            with self._lock:
+                self.misses += 1
+            try:
+                model = build()
+                self.put(key, model)
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+            return model
+
+    def put(self, key, model):
+        size = estimate_size(model)
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (model, size)
+            self.total_bytes += size
+            self._evict()
+
+    def _evict(self):
+        # 방금 넣은 모델 하나는 예산을 넘더라도 남겨 둠
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,113 @@
+"""연관 규칙을 CSV 또는 Parquet으로 청크 단위 스트리밍 내보내기.
+
+정수 코드 직무 집합은 청크마다 직무명으로 변환하므로 규칙 전체를 한 번에 문자열로 만들지 않습니다.
+
+헤드리스 사용 예:
+    python job_prediction/rule_export.py --format parquet --output rules.parquet
+    python job_prediction/rule_export.py --data my_paths.csv --min-support 0.005 --output rules.csv
+"""
+import argparse
+import io
+import os
+import sys
+
+import numpy as np
+
+from rule_mining import load_career_paths, mine_rules
+
+# 한 번에 변환/기록할 규칙 수
+DEFAULT_CHUNKSIZE = 50_000
+
+EXPORT_FORMATS = {
+    'csv': ('association_rules.csv', 'text/csv'),
+    'parquet': ('association_rules.parquet', 'application/vnd.apache.parquet'),
+}
+
+
+def iter_rule_chunks(rules, chunksize=DEFAULT_CHUNKSIZE):
+    """RuleSet을 chunksize 단위로 잘라 순서대로 반환"""
+    # 규칙이 없어도 헤더/스키마는 기록되도록 빈 청크 하나는 반환
+    for start in range(0, max(len(rules), 1), chunksize):
+        yield rules.take(np.arange(start, min(start + chunksize, len(rules))))
+
+
+def write_csv(rules, out, chunksize=DEFAULT_CHUNKSIZE):
+    """CSV로 기록 - 직무 목록은 ', '로 이어 붙인 문자열"""
+    if isinstance(out, (str, os.PathLike)):
+        with open(out, 'w', encoding='utf-8', newline='') as f:
+            write_csv(rules, f, chunksize)
+        return
+
+    for i, chunk in enumerate(iter_rule_chunks(rules, chunksize)):
+        chunk.to_frame(itemsets='string').to_csv(out, header=(i == 0), index=False)
+
+
+def _list_array(pa, chunk, side):
+    """CSR 직무 코드를 그대로 Arrow list<string> 배열로 변환"""
+    offsets, items = chunk.csr(side)
+    return pa.ListArray.from_arrays(pa.array(offsets, type=pa.int32()), pa.array(chunk.titles[items], type=pa.string()))
+
+
+def write_parquet(rules, out, chunksize=DEFAULT_CHUNKSIZE):
+    """Parquet으로 기록 - 직무 목록은 list<string> 열 (pyarrow 필요)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    metric_columns = list(rules.metrics)
+    schema = pa.schema(
+        [('antecedents', pa.list_(pa.string())), ('consequents', pa.list_(pa.string()))]
+        + [(col, pa.float64()) for col in metric_columns]
+    )
+
+    with pq.ParquetWriter(out, schema) as writer:
+        for chunk in iter_rule_chunks(rules, chunksize):
+            arrays = [_list_array(pa, chunk, 'antecedents'), _list_array(pa, chunk, 'consequents')]
+            arrays += [pa.array(chunk.metrics[col]) for col in metric_columns]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+
+def export_rules(rules, out, fmt='csv', chunksize=DEFAULT_CHUNKSIZE):
+    """fmt('csv' 또는 'parquet') 형식으로 out(경로 또는 파일 객체)에 기록"""
+    if fmt == 'csv':
+        write_csv(rules, out, chunksize)
+    elif fmt == 'parquet':
+        write_parquet(rules, out, chunksize)
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+
+
+def export_rules_bytes(rules, fmt='csv', chunksize=DEFAULT_CHUNKSIZE):
+    """다운로드 버튼용 - 메모리 버퍼에 기록한 바이트를 반환"""
+    buffer = io.BytesIO()
+    if fmt == 'csv':
+        # 문자열 버퍼를 거치지 않고 바로 UTF-8 바이트로 기록해 파일 크기만큼의 사본이 하나만 생기게 함
+        text = io.TextIOWrapper(buffer, encoding='utf-8', newline='')
+        write_csv(rules, text, chunksize)
+        text.flush()
+        text.detach()
+    else:
+        export_rules(rules, buffer, fmt, chunksize)
+    return buffer.getvalue()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='직무 경로 데이터에서 연관 규칙을 마이닝해 파일로 내보냅니다.')
+    parser.add_argument('--data', default=None, help='직무 경로 CSV (기본값: 내장 데이터셋)')
+    parser.add_argument('--min-support', type=float, default=0.001, help='최소 지지도')
+    parser.add_argument('--min-confidence', type=float, default=0.1, help='최소 신뢰도')
+    parser.add_argument('--format', choices=sorted(EXPORT_FORMATS), default=None,
+                        help='출력 형식 (기본값: 출력 파일 확장자로 판단)')
+    parser.add_argument('--output', required=True, help='출력 파일 경로')
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help='청크당 규칙 수')
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ('parquet' if args.output.endswith('.parquet') else 'csv')
+
+    career_paths, unique_positions = load_career_paths(args.data)
+    rules = mine_rules(career_paths, unique_positions, args.min_support, args.min_confidence)
+    export_rules(rules, args.output, fmt, args.chunksize)
+    print(f"{len(rules)}개의 규칙을 {args.output}에 저장했습니다.", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
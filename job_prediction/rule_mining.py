@@ -0,0 +1,103 @@
+"""직무 경로 데이터 로드와 연관 규칙 마이닝.
+
+Streamlit에 의존하지 않으므로 app.py와 헤드리스 도구(rule_export.py 등)가 함께 사용합니다.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+from mlxtend.frequent_patterns import apriori, association_rules
+
+from rule_set import RuleSet
+
+# 내장 데이터셋 경로 (app.py와 같은 폴더)
+DEFAULT_DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'path_dataset.csv')
+
+
+def read_path_table(source=None):
+    """직무 경로 CSV를 DataFrame으로 읽기 - source가 None이면 내장 데이터셋 사용"""
+    if source is None:
+        return pd.read_csv(DEFAULT_DATASET, encoding='utf-8')
+
+    # 사용자가 업로드한 파일은 인코딩과 구분자를 추정해서 읽음
+    for encoding in ['utf-8', 'cp949', 'euc-kr']:
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        try:
+            df = pd.read_csv(source, encoding=encoding, sep=None, engine='python')
+            if not df.empty:
+                return df
+        except UnicodeDecodeError:
+            continue
+        except Exception:
+            continue
+    raise ValueError("데이터를 읽을 수 없습니다. CSV 파일 형식을 확인해주세요.")
+
+
+def load_career_paths(source=None):
+    """(직무 경로 리스트, 정렬된 유니크 직무 목록)을 반환"""
+    df = read_path_table(source)
+
+    # 직무 경로를 하나의 문자열로 결합
+    df['career_path'] = df.iloc[:, 1:].apply(
+        lambda x: ','.join([str(pos) for pos in x if pd.notna(pos) and str(pos).strip()]), axis=1
+    )
+
+    # 직무 경로를 리스트로 변환
+    career_paths = df['career_path'].str.split(',').tolist()
+
+    # 유니크한 직무 목록 생성
+    unique_positions = sorted(set([pos.strip() for path in career_paths for pos in path if pos.strip()]))
+
+    return career_paths, unique_positions
+
+
+def mine_rules(career_paths, unique_positions, min_support=0.001, min_confidence=0.1):
+    """Apriori로 연관 규칙을 마이닝하고 필터링/정렬한 RuleSet을 반환
+
+    직무는 unique_positions의 순서를 코드로 사용하며, 마이닝부터 정렬까지 정수 코드로만 다룹니다.
+    """
+    codes = {pos: i for i, pos in enumerate(unique_positions)}
+
+    # 트랜잭션 행렬 생성 (경로 × 직무 불리언)
+    paths = [path for path in career_paths if path]
+    transactions = np.zeros((len(paths), len(unique_positions)), dtype=bool)
+    for row, path in enumerate(paths):
+        transactions[row, [codes[pos.strip()] for pos in path if pos.strip() in codes]] = True
+
+    # Apriori 알고리즘 적용 - 열 번호(직무 코드)로 아이템 집합 생성
+    frequent_itemsets = apriori(
+        pd.DataFrame(transactions),
+        min_support=min_support,
+        use_colnames=False,
+        max_len=3  # 최대 아이템 조합 개수 설정
+    )
+
+    if frequent_itemsets.empty:
+        return RuleSet.empty_set(unique_positions)
+
+    # 연관성 규칙 생성 - metric과 min_threshold 조정
+    rules = association_rules(
+        frequent_itemsets,
+        metric="confidence",
+        min_threshold=min_confidence,
+        support_only=False  # 다양한 메트릭 계산
+    )
+
+    if rules.empty:
+        return RuleSet.empty_set(unique_positions)
+
+    metric_columns = [col for col in rules.columns if col not in ('antecedents', 'consequents')]
+    rule_set = RuleSet.from_itemsets(
+        unique_positions,
+        rules['antecedents'],
+        rules['consequents'],
+        {col: rules[col] for col in metric_columns},
+    )
+
+    # 규칙 필터링 및 정렬
+    keep = (
+        (rule_set.metrics['lift'] > 1.0) &  # 양의 상관관계만 선택
+        (rule_set.lengths('antecedents') <= 2)  # 선행항목 개수 제한
+    )
+    return rule_set.take(np.flatnonzero(keep)).sort(['confidence', 'lift', 'support'])
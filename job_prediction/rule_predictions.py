@@ -0,0 +1,113 @@
+"""연관 규칙에서 미리 계산한 문맥별 상위 k개 다음 직무 예측 테이블.
+
+규칙 모델 하나당 한 번만 만들어 두고, 예측 시에는 선택한 직무 집합의 부분집합들을
+딕셔너리에서 찾아 합치기만 합니다 (선택 가능한 직무는 최대 4개이므로 조회 횟수가 상수).
+테이블은 직무 코드로 저장하며 직무명은 반환하는 Prediction에만 채웁니다.
+"""
+from collections import namedtuple
+from itertools import combinations
+
+import numpy as np
+
+# 예측 결과 한 건 - UI와 배치 호출에서 공통으로 사용
+Prediction = namedtuple('Prediction', ['title', 'confidence', 'lift', 'support', 'count'])
+
+# 문맥에 이미 포함된 직무를 제외하고도 k개를 채울 수 있도록 여유분을 더 저장
+CONTEXT_SLACK = 4
+
+
+def _rank_key(candidate):
+    code, confidence, lift, support, _ = candidate
+    return (-confidence, -lift, -support, code)
+
+
+def _insert(table, key, candidate):
+    """key의 후보 목록에 직무별 최고 점수만 유지하며 추가"""
+    candidates = table.setdefault(key, {})
+    best = candidates.get(candidate[0])
+    if best is None or _rank_key(candidate) < _rank_key(best):
+        candidates[candidate[0]] = candidate
+
+
+class PredictionTable:
+    """선행 직무 코드 집합(문맥) → 점수순 다음 직무 후보 목록"""
+
+    def __init__(self, rule_set, n_transactions, k=10):
+        self.k = k
+        self.titles = rule_set.titles
+        self.title_codes = {title: code for code, title in enumerate(self.titles)}
+        depth = k + CONTEXT_SLACK
+        by_context = {}
+        by_item = {}
+
+        counts = np.rint(rule_set.metrics['support'] * n_transactions).astype(np.int64)
+        columns = [
+            rule_set.itemset_codes('antecedents'),
+            rule_set.itemset_codes('consequents'),
+            rule_set.metrics['confidence'].tolist(),
+            rule_set.metrics['lift'].tolist(),
+            rule_set.metrics['support'].tolist(),
+            counts.tolist(),
+        ]
+        for antecedents, consequents, confidence, lift, support, count in zip(*columns):
+            antecedents = antecedents.tolist()
+            context = frozenset(antecedents)
+            for code in consequents.tolist():
+                candidate = (code, confidence, lift, support, count)
+                _insert(by_context, context, candidate)
+                for item in antecedents:
+                    _insert(by_item, item, candidate)
+
+        self.by_context = {key: sorted(c.values(), key=_rank_key)[:depth] for key, c in by_context.items()}
+        self.by_item = {key: sorted(c.values(), key=_rank_key)[:depth] for key, c in by_item.items()}
+        self.max_context = max((len(key) for key in self.by_context), default=0)
+
+    def __len__(self):
+        return len(self.by_context)
+
+    def predict_codes(self, current_codes, k=None):
+        """현재 직무 코드들에 대한 상위 k개 (코드, 신뢰도, 향상도, 지지도, 건수) 리스트
+
+        선행 항목이 현재 직무의 부분집합인 규칙을 우선 사용하고, 없으면 현재 직무 중 하나라도
+        선행 항목에 포함된 규칙으로 대체합니다.
+        """
+        k = k or self.k
+        current = set(current_codes)
+
+        candidates = []
+        for size in range(1, min(len(current), self.max_context) + 1):
+            for context in combinations(sorted(current), size):
+                candidates.extend(self.by_context.get(frozenset(context), []))
+        if not candidates:
+            for item in current:
+                candidates.extend(self.by_item.get(item, []))
+
+        results = []
+        seen = set(current)
+        for candidate in sorted(candidates, key=_rank_key):
+            if candidate[0] in seen:
+                continue
+            seen.add(candidate[0])
+            results.append(candidate)
+            if len(results) == k:
+                break
+        return results
+
+    def encode(self, titles):
+        """직무명들을 직무 코드 리스트로 변환 - 규칙 어휘에 없는 직무는 제외"""
+        return [self.title_codes[title] for title in titles if title in self.title_codes]
+
+    def to_predictions(self, candidates):
+        """predict_codes 결과를 표시용 Prediction 리스트로 변환"""
+        return [
+            Prediction(self.titles[code], confidence, lift, support, count)
+            for code, confidence, lift, support, count in candidates
+        ]
+
+    def predict(self, current_positions, k=None):
+        """현재 직무명들에 대한 상위 k개 Prediction 리스트"""
+        return self.to_predictions(self.predict_codes(self.encode(current_positions), k))
+
+    def predict_many(self, contexts, k=None):
+        """배치 예측 - 문맥 리스트와 같은 순서의 Prediction 리스트들을 반환"""
+        return [self.predict(context, k) for context in contexts]
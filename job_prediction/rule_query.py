@@ -0,0 +1,111 @@
+"""마이닝된 연관 규칙에 대한 대화형 질의 엔진.
+
+RuleSet의 지표 배열과 정수 코드 직무 집합으로 직무→규칙 인덱스를 만들어 두고,
+이후의 필터링/정렬/페이지 나누기는 모두 배열 연산으로 처리합니다.
+"""
+import numpy as np
+
+# 범위 필터와 정렬에 사용할 수 있는 지표
+METRIC_COLUMNS = ['support', 'confidence', 'lift', 'leverage', 'conviction']
+
+# 직무 검색 대상
+SIDES = ('any', 'antecedents', 'consequents')
+
+
+def _build_item_index(offsets, items, n_titles):
+    """CSR 직무 집합을 직무 코드 → 규칙 번호 배열(오름차순) 딕셔너리로 변환"""
+    rule_ids = np.repeat(np.arange(len(offsets) - 1, dtype=np.int64), np.diff(offsets))
+
+    # 직무 코드 기준으로 정렬한 뒤 코드별 구간으로 잘라 규칙 번호 목록을 만든다
+    order = np.argsort(items, kind='stable')
+    bounds = np.searchsorted(items[order], np.arange(n_titles + 1))
+    sorted_rule_ids = rule_ids[order]
+    return {
+        code: sorted_rule_ids[bounds[code]:bounds[code + 1]]
+        for code in range(n_titles) if bounds[code] < bounds[code + 1]
+    }
+
+
+class RuleIndex:
+    """RuleSet 위의 열 지향 질의 인덱스"""
+
+    def __init__(self, rule_set):
+        self.rule_set = rule_set
+        self.size = len(rule_set)
+        self.metrics = {col: rule_set.metrics[col] for col in METRIC_COLUMNS if col in rule_set.metrics}
+        self.antecedent_len = rule_set.lengths('antecedents')
+        n_titles = len(rule_set.titles)
+        self.antecedent_index = _build_item_index(rule_set.antecedent_offsets, rule_set.antecedent_items, n_titles)
+        self.consequent_index = _build_item_index(rule_set.consequent_offsets, rule_set.consequent_items, n_titles)
+        # 규칙에 한 번이라도 등장하는 직무 코드
+        self.codes = sorted(set(self.antecedent_index) | set(self.consequent_index))
+
+    def metric_bounds(self, metric):
+        """슬라이더 범위로 쓸 (최소, 최대) 값 - 무한대는 제외"""
+        values = self.metrics[metric]
+        finite = values[np.isfinite(values)]
+        if finite.size == 0:
+            return 0.0, 0.0
+        return float(finite.min()), float(finite.max())
+
+    def _code_rules(self, code, side):
+        if side not in SIDES:
+            raise ValueError(f"side는 {SIDES} 중 하나여야 합니다: {side}")
+        empty = np.empty(0, dtype=np.int64)
+        if side == 'antecedents':
+            return self.antecedent_index.get(code, empty)
+        if side == 'consequents':
+            return self.consequent_index.get(code, empty)
+        return np.union1d(self.antecedent_index.get(code, empty), self.consequent_index.get(code, empty))
+
+    def filter(self, code=None, side='any', lift=None, leverage=None, conviction=None,
+               antecedent_len=None):
+        """조건을 모두 만족하는 규칙 번호 배열을 반환
+
+        code는 side 쪽 직무 집합에 포함되어야 하는 직무 코드이고,
+        범위 조건은 (최소, 최대) 튜플이며, 어느 한쪽이 None이면 그 방향은 제한하지 않습니다.
+        """
+        mask = np.ones(self.size, dtype=bool)
+        if code is not None:
+            mask[:] = False
+            mask[self._code_rules(code, side)] = True
+
+        for metric, bounds in (('lift', lift), ('leverage', leverage), ('conviction', conviction)):
+            if bounds is None:
+                continue
+            low, high = bounds
+            values = self.metrics[metric]
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+
+        if antecedent_len is not None:
+            low, high = antecedent_len
+            if low is not None:
+                mask &= self.antecedent_len >= low
+            if high is not None:
+                mask &= self.antecedent_len <= high
+
+        return np.flatnonzero(mask)
+
+    def page(self, rule_ids, sort_by='confidence', ascending=False, page=1, page_size=50):
+        """규칙 번호 배열을 지표 기준으로 정렬한 뒤 한 페이지 분량의 규칙 DataFrame을 반환
+
+        직무 코드는 반환되는 페이지에 대해서만 문자열로 변환합니다.
+        """
+        if sort_by not in self.metrics:
+            raise ValueError(f"정렬할 수 없는 지표입니다: {sort_by}")
+
+        values = self.metrics[sort_by][rule_ids]
+        order = np.argsort(values if ascending else -values, kind='stable')
+
+        start = max(page - 1, 0) * page_size
+        page_ids = rule_ids[order[start:start + page_size]]
+
+        return self.rule_set.take(page_ids).to_frame(itemsets='string')
+
+    def query(self, sort_by='confidence', ascending=False, page=1, page_size=50, **filters):
+        """필터링 → 정렬 → 페이지 나누기를 거친 (규칙 DataFrame, 전체 건수)를 반환"""
+        rule_ids = self.filter(**filters)
+        return self.page(rule_ids, sort_by, ascending, page, page_size), len(rule_ids)
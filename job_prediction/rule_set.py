@@ -0,0 +1,131 @@
+"""정수 코드로 저장한 연관 규칙 집합.
+
+선행/후행 직무 집합은 CSR 형태(규칙별 시작 위치 offsets + 직무 코드 items)로, 지표는 float 배열로 보관합니다.
+필터링/정렬/부분 선택은 모두 NumPy 연산이며, frozenset이나 문자열은 화면 표시나 내보내기 직전에만 만듭니다.
+"""
+import numpy as np
+import pandas as pd
+
+SIDES = ('antecedents', 'consequents')
+
+# 규칙이 없을 때 기본으로 갖는 지표
+DEFAULT_METRICS = ('support', 'confidence', 'lift')
+
+
+def _to_csr(itemsets):
+    """정수 집합들의 리스트를 (offsets, items)로 변환 - 규칙마다 코드 오름차순"""
+    lengths = np.fromiter((len(items) for items in itemsets), dtype=np.int64, count=len(itemsets))
+    offsets = np.zeros(len(itemsets) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    items = np.fromiter((code for s in itemsets for code in sorted(s)), dtype=np.int32, count=int(offsets[-1]))
+    return offsets, items
+
+
+def _gather(offsets, items, ids):
+    """ids 순서대로 규칙을 골라 새 (offsets, items)를 만든다"""
+    lengths = offsets[ids + 1] - offsets[ids]
+    new_offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=new_offsets[1:])
+    positions = np.arange(new_offsets[-1], dtype=np.int64) + np.repeat(offsets[ids] - new_offsets[:-1], lengths)
+    return new_offsets, items[positions]
+
+
+class RuleSet:
+    """정수 코드 CSR 직무 집합 + 지표 배열로 이루어진 규칙 집합"""
+
+    def __init__(self, titles, antecedent_offsets, antecedent_items, consequent_offsets, consequent_items, metrics):
+        self.titles = np.asarray(titles, dtype=object)
+        self.antecedent_offsets = antecedent_offsets
+        self.antecedent_items = antecedent_items
+        self.consequent_offsets = consequent_offsets
+        self.consequent_items = consequent_items
+        self.metrics = metrics
+
+    @classmethod
+    def from_itemsets(cls, titles, antecedents, consequents, metrics):
+        """정수 코드 집합(mlxtend의 use_colnames=False 결과 등)으로 생성"""
+        return cls(titles, *_to_csr(list(antecedents)), *_to_csr(list(consequents)),
+                   {name: np.asarray(values, dtype=np.float64) for name, values in metrics.items()})
+
+    @classmethod
+    def empty_set(cls, titles, metric_names=DEFAULT_METRICS):
+        """규칙이 하나도 없는 RuleSet"""
+        offsets = np.zeros(1, dtype=np.int64)
+        items = np.empty(0, dtype=np.int32)
+        return cls(titles, offsets, items, offsets, items, {name: np.empty(0) for name in metric_names})
+
+    def __len__(self):
+        return len(self.antecedent_offsets) - 1
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    @property
+    def columns(self):
+        return list(SIDES) + list(self.metrics)
+
+    def csr(self, side):
+        """side 직무 집합의 (offsets, items) 배열"""
+        if side == 'antecedents':
+            return self.antecedent_offsets, self.antecedent_items
+        if side == 'consequents':
+            return self.consequent_offsets, self.consequent_items
+        raise ValueError(f"side는 {SIDES} 중 하나여야 합니다: {side}")
+
+    def lengths(self, side='antecedents'):
+        return np.diff(self.csr(side)[0])
+
+    def take(self, ids):
+        """규칙 번호 배열 순서대로 고른 새 RuleSet"""
+        ids = np.asarray(ids, dtype=np.int64)
+        return RuleSet(
+            self.titles,
+            *_gather(self.antecedent_offsets, self.antecedent_items, ids),
+            *_gather(self.consequent_offsets, self.consequent_items, ids),
+            {name: values[ids] for name, values in self.metrics.items()},
+        )
+
+    def sort(self, by, ascending=False):
+        """여러 지표 기준 안정 정렬 - by의 앞쪽 지표가 우선"""
+        keys = [self.metrics[name] if ascending else -self.metrics[name] for name in reversed(by)]
+        return self.take(np.lexsort(keys))
+
+    def itemset_codes(self, side):
+        """규칙별 직무 코드 배열 리스트"""
+        offsets, items = self.csr(side)
+        if len(offsets) == 1:
+            return []
+        return np.split(items, offsets[1:-1])
+
+    def itemsets(self, side):
+        """규칙별 직무명 frozenset 리스트 (표시용)"""
+        return [frozenset(self.titles[codes]) for codes in self.itemset_codes(side)]
+
+    def itemset_lists(self, side):
+        """규칙별 직무명 리스트 (Parquet list 열용)"""
+        return [self.titles[codes].tolist() for codes in self.itemset_codes(side)]
+
+    def itemset_strings(self, side, sep=', '):
+        """규칙별 직무명을 sep로 이어 붙인 문자열 리스트 (표시/CSV용)"""
+        return [sep.join(self.titles[codes]) for codes in self.itemset_codes(side)]
+
+    def to_frame(self, itemsets='string'):
+        """DataFrame으로 변환 - itemsets는 'string', 'list' 또는 'frozenset'"""
+        if itemsets == 'string':
+            convert = self.itemset_strings
+        elif itemsets == 'list':
+            convert = self.itemset_lists
+        elif itemsets == 'frozenset':
+            convert = self.itemsets
+        else:
+            raise ValueError(f"지원하지 않는 형식입니다: {itemsets}")
+        frame = pd.DataFrame({side: convert(side) for side in SIDES})
+        for name, values in self.metrics.items():
+            frame[name] = values
+        return frame
+
+    @property
+    def nbytes(self):
+        arrays = [self.antecedent_offsets, self.antecedent_items, self.consequent_offsets, self.consequent_items]
+        return sum(a.nbytes for a in arrays) + sum(v.nbytes for v in self.metrics.values())
@@ -5,176 +5,217 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from path_predictions import STEP_COLUMNS, PathPredictionTable, extract_paths, title_vocabulary
+from career_neighbors import CareerNeighbors
+from path_trajectory import TrajectoryProjector
+from path_stats import DatasetStats
+from title_picker import TitleSearch, title_selectbox
+
 # 앱 제목
 st.title('🎯 직무 이동 경로 예측기')
 st.write('현재까지의 직무 경로를 입력하면 다음 직무를 예측해드립니다.')
 
-# 데이터 로드
-@st.cache_data
-def load_data():
-    try:
-        # 현재 파일(app.py)의 디렉토리 경로 구하기
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-    except NameError:
-        # __file__ 변수가 없는 경우 현재 작업 디렉토리 사용
-        current_dir = os.getcwd()
-    
-    # CSV 파일 경로 만들기 (app.py와 같은 폴더)
-    csv_path = os.path.join(current_dir, 'path_dataset.csv')
-    df = pd.read_csv(csv_path)
-    return df
-
-df = load_data()
-
-# 모든 unique 직무 추출
-all_positions = set()
-for col in ['1차 이동 직무', '2차 이동 직무', '3차 이동 직무', '4차 이동 직무']:
-    all_positions.update(df[col].dropna().unique())
-all_positions = sorted(list(all_positions))
+try:
+    # 현재 파일(app.py)의 디렉토리 경로 구하기
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+except NameError:
+    # __file__ 변수가 없는 경우 현재 작업 디렉토리 사용
+    current_dir = os.getcwd()
+
+# CSV 파일 경로 만들기 (app.py와 같은 폴더)
+csv_path = os.path.join(current_dir, 'path_dataset.csv')
+
+# 데이터 버전 - 아래 캐시들은 DataFrame 대신 이 값으로 조회하므로 rerun마다 데이터 전체를 해싱하지 않음
+def dataset_version():
+    stat = os.stat(csv_path)
+    return stat.st_mtime_ns, stat.st_size
+
+# 데이터 로드 - 모델을 새로 만들 때만 호출
+@st.cache_data(max_entries=1)
+def load_data(version):
+    return pd.read_csv(csv_path)
+
+# 예측 테이블 - 데이터 버전당 한 번만 생성, 직무 코드는 선택 상자와 같은 어휘를 사용
+@st.cache_resource(max_entries=1)
+def build_prediction_table(version):
+    df = load_data(version)
+    return PathPredictionTable(extract_paths(df), titles=title_vocabulary(df))
+
+# 직무 선택 상자용 검색 인덱스 - 모든 세션이 공유
+@st.cache_resource(max_entries=1)
+def build_title_search(version):
+    return TitleSearch(build_prediction_table(version).titles)
+
+# 유사 경로 추천기 - 경로/마지막 직무 기준 예측이 모두 없을 때 사용
+@st.cache_resource(max_entries=1)
+def build_career_neighbors(version):
+    return CareerNeighbors(extract_paths(load_data(version)))
+
+# 경로 전망기 - 확장 결과 캐시를 모든 세션이 공유
+@st.cache_resource(max_entries=1)
+def build_trajectory_projector(version):
+    return TrajectoryProjector(build_prediction_table(version))
+
+# 데이터 통계 - 서버 전체에서 하나를 유지하며 파일 끝에 추가된 행만 누적 (기존 행이 바뀌면 다시 집계)
+@st.cache_resource
+def build_dataset_stats():
+    return DatasetStats()
+
+# 데이터 버전이 바뀔 때마다 한 번만 통계를 새 데이터에 맞춤
+@st.cache_resource(max_entries=1)
+def sync_dataset_stats(version):
+    return build_dataset_stats().sync(load_data(version))
+
+data_version = dataset_version()
+prediction_table = build_prediction_table(data_version)
+
+# 직무 코드는 데이터 버전마다 뜻이 다를 수 있으므로 선택 상자 키에 버전을 포함
+data_key = '{}_{}'.format(*data_version)
+
+title_search = build_title_search(data_version)
 
 # 직무 선택 UI
 st.subheader('🔍 현재까지의 직무 경로를 선택하세요')
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    position1 = st.selectbox('1차 직무', ['선택 안함'] + all_positions)
+    position1 = title_selectbox('1차 직무', title_search, key=f'position1_{data_key}', placeholder='선택 안함')
 with col2:
-    position2 = st.selectbox('2차 직무', ['선택 안함'] + all_positions)
+    position2 = title_selectbox('2차 직무', title_search, key=f'position2_{data_key}', placeholder='선택 안함')
 with col3:
-    position3 = st.selectbox('3차 직무', ['선택 안함'] + all_positions)
+    position3 = title_selectbox('3차 직무', title_search, key=f'position3_{data_key}', placeholder='선택 안함')
 with col4:
-    position4 = st.selectbox('4차 직무', ['선택 안함'] + all_positions)
+    position4 = title_selectbox('4차 직무', title_search, key=f'position4_{data_key}', placeholder='선택 안함')
+
+# 예측 방식 선택
+prediction_mode = st.radio('예측 방식', ['다음 직무', '향후 경로 전망'], horizontal=True)
+if prediction_mode == '향후 경로 전망':
+    projection_steps = st.slider('전망할 단계 수', min_value=2, max_value=5, value=3)
 
 # 예측 버튼
 if st.button('다음 직무 예측하기'):
-    # 입력된 경로 생성
-    current_path = []
-    for pos in [position1, position2, position3, position4]:
-        if pos != '선택 안함':
-            current_path.append(pos)
+    # 입력된 경로 생성 - 예측은 직무 코드 튜플로, 직무명은 표시할 때만 사용
+    current_codes = tuple(code for code in [position1, position2, position3, position4] if code is not None)
+    current_path = prediction_table.decode(current_codes)
     
     if len(current_path) == 0:
         st.error('최소 하나 이상의 직무를 선택해주세요.')
-    else:
+    elif prediction_mode == '향후 경로 전망':
         # --------------------------------------------------------------------------------
-        # 1) CSV 내 모든 경로를 수집
+        # 빔 서치로 여러 단계 앞의 경로 전망
         # --------------------------------------------------------------------------------
-        paths = []
-        for _, row in df.iterrows():
-            path = []
-            for col in ['1차 이동 직무', '2차 이동 직무', '3차 이동 직무', '4차 이동 직무']:
-                if pd.notna(row[col]):  # NaN 체크
-                    path.append(row[col])
-            # 최소 2개 이상의 직무가 있는 경우만 유효한 경로로 간주
-            if len(path) >= 2:
-                paths.append('→'.join(path))
-
+        trajectories = build_trajectory_projector(data_version).project_codes(current_codes, steps=projection_steps)
+
+        st.write("입력된 경로:", '→'.join(current_path))
+        if trajectories:
+            st.subheader(f'🧭 향후 경로 전망 (최대 {projection_steps}단계)')
+            for i, t in enumerate(trajectories, 1):
+                projected = prediction_table.decode(t.path)
+                st.write(f"{i}. {'→'.join(current_path)} → **{'→'.join(projected)}**: {t.probability * 100:.1f}%")
+        else:
+            st.warning('입력하신 경로 이후로 이어지는 직무 이동 데이터를 찾을 수 없습니다.')
+    else:
         # --------------------------------------------------------------------------------
-        # 2) "입력된 전체 경로"에 매칭되는 다음 직무 찾기
+        # 1) 미리 계산된 예측 테이블에서 "입력된 전체 경로" 또는 "마지막 직무" 기준 다음 직무 조회
         # --------------------------------------------------------------------------------
-        current_path_str = '→'.join(current_path)
-        st.write("입력된 경로:", current_path_str)
-        st.write("전체 경로 수:", len(paths))
-
-        next_positions = []
-        for path in paths:
-            path_parts = path.split('→')
-            # 현재 경로 길이만큼 prefix가 정확히 일치하면, 그 다음 직무를 추출
-            if len(current_path) <= len(path_parts):
-                if all(a == b for a, b in zip(current_path, path_parts[:len(current_path)])):
-                    if len(path_parts) > len(current_path):
-                        next_positions.append(path_parts[len(current_path)])
+        candidates, basis = prediction_table.predict_codes(current_codes)
+        predictions = prediction_table.to_predictions(candidates)
 
-        # --------------------------------------------------------------------------------
-        # 3) 예측 결과(전체 경로 기준) 출력
-        # --------------------------------------------------------------------------------
-        if next_positions:
-            # 3-1) 다음 직무 빈도 계산
-            next_pos_freq = pd.Series(next_positions).value_counts()
-            total_count = len(next_positions)
+        st.write("입력된 경로:", '→'.join(current_path))
+        st.write("전체 경로 수:", prediction_table.n_paths)
 
+        if basis == 'path':
+            # --------------------------------------------------------------------------------
+            # 2) 예측 결과(전체 경로 기준) 출력
+            # --------------------------------------------------------------------------------
             st.subheader('📊 예측 결과 (전체 경로 기준)')
-            for pos, count in next_pos_freq.items():
-                probability = count / total_count * 100
-                st.write(f"**{pos}**: {probability:.1f}% ({count}건)")
+            for p in predictions:
+                st.write(f"**{p.title}**: {p.confidence * 100:.1f}% ({p.count}건)")
 
-            # 3-2) 시각화
+            # 시각화
             fig, ax = plt.subplots(figsize=(10, 6))
-            sns.barplot(x=next_pos_freq.index, y=next_pos_freq.values)
+            sns.barplot(x=[p.title for p in predictions], y=[p.count for p in predictions])
             plt.xticks(rotation=45, ha='right')
             plt.title('다음 직무 예측 결과')
             plt.xlabel('다음 직무')
             plt.ylabel('빈도')
             st.pyplot(fig)
 
-            # 3-3) 유사 경로 예시
+            # 유사 경로 예시
             st.subheader('📋 유사 경로 예시')
-            similar_paths = [path for path in paths if path.startswith(current_path_str)]
-            for i, spath in enumerate(similar_paths[:5], 1):
-                st.write(f"{i}. {spath}")
+            for i, spath in enumerate(prediction_table.similar_path_codes(current_codes), 1):
+                st.write(f"{i}. {'→'.join(prediction_table.decode(spath))}")
 
-        else:
+        elif basis == 'last':
             # --------------------------------------------------------------------------------
-            # 4) Fallback: "마지막 직무" 기준으로만 예측
+            # 3) Fallback: "마지막 직무" 기준으로만 예측
             # --------------------------------------------------------------------------------
             last_job = current_path[-1]
-            fallback_positions = []
-
-            # paths에 대해, "마지막 직무 → 다음 직무" 형태가 있으면 수집
-            for path in paths:
-                path_parts = path.split('→')
-                for i in range(len(path_parts) - 1):
-                    if path_parts[i] == last_job:
-                        fallback_positions.append(path_parts[i+1])
-
-            if fallback_positions:
-                st.info(f"입력하신 전체 경로와 일치하는 사례는 없지만, "
-                        f"마지막 직무 **{last_job}** 에서의 이동 데이터를 바탕으로 예측합니다.")
-                
-                next_pos_freq = pd.Series(fallback_positions).value_counts()
-                total_count = len(fallback_positions)
-
-                st.subheader('📊 예측 결과 (마지막 직무 기준)')
-                for pos, count in next_pos_freq.items():
-                    probability = count / total_count * 100
-                    st.write(f"**{pos}**: {probability:.1f}% ({count}건)")
-
-                # 시각화
-                fig, ax = plt.subplots(figsize=(10, 6))
-                sns.barplot(x=next_pos_freq.index, y=next_pos_freq.values)
-                plt.xticks(rotation=45, ha='right')
-                plt.title(f'직무 "{last_job}" 기준 다음 직무 예측 결과')
-                plt.xlabel('다음 직무')
-                plt.ylabel('빈도')
-                st.pyplot(fig)
+            st.info(f"입력하신 전체 경로와 일치하는 사례는 없지만, "
+                    f"마지막 직무 **{last_job}** 에서의 이동 데이터를 바탕으로 예측합니다.")
+
+            st.subheader('📊 예측 결과 (마지막 직무 기준)')
+            for p in predictions:
+                st.write(f"**{p.title}**: {p.confidence * 100:.1f}% ({p.count}건)")
+
+            # 시각화
+            fig, ax = plt.subplots(figsize=(10, 6))
+            sns.barplot(x=[p.title for p in predictions], y=[p.count for p in predictions])
+            plt.xticks(rotation=45, ha='right')
+            plt.title(f'직무 "{last_job}" 기준 다음 직무 예측 결과')
+            plt.xlabel('다음 직무')
+            plt.ylabel('빈도')
+            st.pyplot(fig)
 
+        else:
+            # --------------------------------------------------------------------------------
+            # 4) Fallback: 가장 비슷한 직무 경로(협업 필터링) 기준 추천
+            # --------------------------------------------------------------------------------
+            recommendations = build_career_neighbors(data_version).recommend(current_path)
+            if recommendations:
+                st.info('입력하신 경로와 마지막 직무 모두 일치하는 사례는 없지만, '
+                        '가장 비슷한 직무 경로들을 바탕으로 추천합니다.')
+
+                st.subheader('📊 예측 결과 (유사 경로 기준)')
+                for r in recommendations:
+                    st.write(f"**{r.title}**: {r.score * 100:.1f}% (유사 경로 {r.neighbors}건)")
             else:
-                # 마지막 직무조차 데이터가 전혀 없을 경우
+                # 비슷한 경로조차 없을 경우
                 st.warning('입력하신 경로(또는 마지막 직무)와 일치하는 다음 직무를 찾을 수 없습니다.')
 
 # --------------------------------------------------------------------------------
 # 5) 데이터 통계
 # --------------------------------------------------------------------------------
-with st.expander('📈 데이터 통계 보기'):
-    st.write('전체 데이터 건수:', len(df))
-    
-    # 직무별 빈도
-    st.subheader('직무별 빈도')
-    position_counts = pd.concat([
-        df[col] for col in ['1차 이동 직무', '2차 이동 직무', '3차 이동 직무', '4차 이동 직무']
-    ]).value_counts()
-
-    # 상위 10개 직무 시각화
-    fig, ax = plt.subplots(figsize=(10, 6))
-    sns.barplot(x=position_counts.head(10).index, y=position_counts.head(10).values)
-    plt.xticks(rotation=45, ha='right')
-    plt.title('상위 10개 직무 빈도')
-    plt.xlabel('직무')
-    plt.ylabel('빈도')
-    st.pyplot(fig)
-
-    # 단계별 직무 수
-    st.subheader('단계별 직무 수')
-    for col in ['1차 이동 직무', '2차 이동 직무', '3차 이동 직무', '4차 이동 직무']:
-        count = df[col].notna().sum()
-        st.write(f"{col}: {count}개")
+# 펼쳤을 때만 내용(차트 포함)을 그리도록 on_change='rerun'으로 열림 상태를 추적
+with st.expander('📈 데이터 통계 보기', key='stats_expander', on_change='rerun') as stats_expander:
+    if stats_expander.open:
+        stats = sync_dataset_stats(data_version)
+        st.write('전체 데이터 건수:', stats.n_rows)
+
+        # 직무별 빈도
+        st.subheader('직무별 빈도')
+        top_titles = stats.top_titles(10)
+
+        # 상위 10개 직무 시각화
+        fig, ax = plt.subplots(figsize=(10, 6))
+        sns.barplot(x=[title for title, _ in top_titles], y=[count for _, count in top_titles])
+        plt.xticks(rotation=45, ha='right')
+        plt.title('상위 10개 직무 빈도')
+        plt.xlabel('직무')
+        plt.ylabel('빈도')
+        st.pyplot(fig)
+
+        # 단계별 직무 수
+        st.subheader('단계별 직무 수')
+        for col, count in zip(STEP_COLUMNS, stats.step_counts):
+            st.write(f"{col}: {count}개")
+
+        # 경로 길이 분포
+        st.subheader('경로 길이 분포')
+        for length, count in stats.length_histogram().items():
+            st.write(f"직무 {length}개: {count}명")
+
+        # 주요 직무 이동
+        st.subheader('주요 직무 이동')
+        for (src, dst), count in stats.top_transitions(10):
+            st.write(f"{src} → {dst}: {count}건")
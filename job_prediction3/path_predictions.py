@@ -0,0 +1,129 @@
+"""직무 경로 prefix별 상위 k개 다음 직무를 미리 계산해 둔 예측 테이블.
+
+데이터셋당 한 번 모든 경로의 prefix와 "직무 → 다음 직무" 이동을 세어 두고,
+예측 시에는 prefix 튜플 또는 마지막 직무로 딕셔너리를 한 번 조회합니다.
+테이블은 직무 코드(직무명 목록에서의 위치) 튜플로 저장하며 직무명은 반환하는 Prediction에만 채웁니다.
+"""
+from collections import Counter, defaultdict, namedtuple
+
+import pandas as pd
+
+# 단계별 직무 열
+STEP_COLUMNS = ['1차 이동 직무', '2차 이동 직무', '3차 이동 직무', '4차 이동 직무']
+
+# 예측 결과 한 건 - UI와 배치 호출에서 공통으로 사용
+Prediction = namedtuple('Prediction', ['title', 'confidence', 'lift', 'support', 'count'])
+
+# prefix별로 보관할 유사 경로 예시 수
+EXAMPLES_PER_PREFIX = 5
+
+
+def extract_paths(df):
+    """DataFrame에서 직무 경로 튜플 리스트를 추출 (최소 2개 이상의 직무가 있는 경로만)"""
+    paths = []
+    for row in df[STEP_COLUMNS].itertuples(index=False):
+        path = tuple(pos for pos in row if pd.notna(pos))
+        if len(path) >= 2:
+            paths.append(path)
+    return paths
+
+
+def title_vocabulary(df):
+    """단계별 직무 열에 등장하는 모든 직무명 (정렬) - 직무 코드는 이 목록에서의 위치"""
+    titles = set()
+    for col in STEP_COLUMNS:
+        titles.update(df[col].dropna().unique())
+    return sorted(titles)
+
+
+def _ranked(counter, base_rate, n_paths, k):
+    """다음 직무 코드 빈도 Counter를 점수순 (코드, 신뢰도, 향상도, 지지도, 건수) 리스트로 변환"""
+    total = sum(counter.values())
+    ranked = sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+    if k is not None:
+        ranked = ranked[:k]
+    return [
+        (code, count / total, (count / total) / base_rate[code], count / n_paths, count)
+        for code, count in ranked
+    ]
+
+
+class PathPredictionTable:
+    """경로 prefix → 다음 직무 후보, 마지막 직무 → 다음 직무 후보 테이블 (모두 직무 코드 기준)"""
+
+    def __init__(self, paths, k=None, titles=None):
+        self.k = k
+        self.n_paths = len(paths)
+        # UI 선택 상자와 같은 어휘를 쓰도록 직무명 목록을 받을 수 있음
+        self.titles = list(titles) if titles is not None else sorted({title for path in paths for title in path})
+        self.title_codes = {title: code for code, title in enumerate(self.titles)}
+
+        by_prefix = defaultdict(Counter)
+        by_last = defaultdict(Counter)
+        self.examples = defaultdict(list)
+        for path in map(self.encode, paths):
+            for i in range(1, len(path) + 1):
+                prefix = path[:i]
+                if len(self.examples[prefix]) < EXAMPLES_PER_PREFIX:
+                    self.examples[prefix].append(path)
+                if i < len(path):
+                    by_prefix[prefix][path[i]] += 1
+                    by_last[path[i - 1]][path[i]] += 1
+
+        # 향상도 계산용 - 전체 이동 중 해당 직무가 다음 직무로 등장한 비율
+        next_counts = Counter()
+        for counter in by_last.values():
+            next_counts.update(counter)
+        n_moves = sum(next_counts.values())
+        base_rate = {code: count / n_moves for code, count in next_counts.items()}
+
+        self.by_prefix = {prefix: _ranked(c, base_rate, self.n_paths, k) for prefix, c in by_prefix.items()}
+        self.by_last = {code: _ranked(c, base_rate, self.n_paths, k) for code, c in by_last.items()}
+        self.examples = dict(self.examples)
+
+    def encode(self, path):
+        """직무명 경로를 직무 코드 튜플로 변환 - 어휘에 없는 직무는 어떤 prefix와도 일치하지 않는 -1"""
+        return tuple(self.title_codes.get(title, -1) for title in path)
+
+    def decode(self, codes):
+        """직무 코드 튜플을 직무명 튜플로 변환 (표시용)"""
+        return tuple(self.titles[code] for code in codes)
+
+    def to_predictions(self, candidates):
+        """predict_codes 결과를 표시용 Prediction 리스트로 변환"""
+        return [
+            Prediction(self.titles[code], confidence, lift, support, count)
+            for code, confidence, lift, support, count in candidates
+        ]
+
+    def predict_codes(self, current_codes, k=None):
+        """직무 코드 경로에 대한 (후보 리스트, 기준)을 반환
+
+        후보는 (코드, 신뢰도, 향상도, 지지도, 건수) 튜플이고, 기준은 'path'(전체 경로), 'last'(마지막 직무) 또는 None입니다.
+        """
+        k = k or self.k
+        current_codes = tuple(current_codes)
+        if not current_codes:
+            return [], None
+
+        candidates = self.by_prefix.get(current_codes)
+        if candidates:
+            return candidates[:k], 'path'
+
+        candidates = self.by_last.get(current_codes[-1])
+        if candidates:
+            return candidates[:k], 'last'
+        return [], None
+
+    def predict(self, current_path, k=None):
+        """직무명 경로에 대한 (Prediction 리스트, 기준)을 반환"""
+        candidates, basis = self.predict_codes(self.encode(current_path), k)
+        return self.to_predictions(candidates), basis
+
+    def predict_many(self, paths, k=None):
+        """배치 예측 - 경로 리스트와 같은 순서의 (Prediction 리스트, 기준)들을 반환"""
+        return [self.predict(path, k) for path in paths]
+
+    def similar_path_codes(self, current_codes):
+        """입력 코드 경로로 시작하는 경로 예시의 코드 튜플 (최대 EXAMPLES_PER_PREFIX개)"""
+        return self.examples.get(tuple(current_codes), [])
@@ -0,0 +1,78 @@
+"""데이터셋 통계 요약 - 직무별 빈도, 단계별 직무 수, 경로 길이 분포, 주요 이동.
+
+모든 통계를 행을 한 번 훑으면서 함께 세고, 데이터가 추가되면 추가된 행만 다시 세어 누적합니다.
+이미 센 행들의 해시를 보관해 두어, 기존 행이 바뀐 데이터는 추가로 보지 않고 처음부터 다시 셉니다.
+"""
+import threading
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from path_predictions import STEP_COLUMNS
+
+
+def _row_hashes(df):
+    """단계별 직무 열 기준 행별 해시 (uint64 배열)"""
+    return pd.util.hash_pandas_object(df[STEP_COLUMNS], index=False).to_numpy()
+
+
+class DatasetStats:
+    """직무 경로 데이터셋의 누적 통계"""
+
+    def __init__(self, df=None):
+        self._lock = threading.Lock()
+        self._reset()
+        if df is not None:
+            self.update(df)
+
+    def _reset(self):
+        self.n_rows = 0
+        self.title_counts = Counter()
+        self.step_counts = [0] * len(STEP_COLUMNS)
+        self.length_counts = Counter()
+        self.transition_counts = Counter()
+        self._hashes = np.empty(0, dtype=np.uint64)
+
+    def update(self, df):
+        """새로 추가된 행들의 통계를 누적"""
+        return self._count(df, _row_hashes(df))
+
+    def _count(self, df, hashes):
+        for row in df[STEP_COLUMNS].itertuples(index=False):
+            path = []
+            for step, title in enumerate(row):
+                if pd.notna(title):
+                    self.step_counts[step] += 1
+                    path.append(title)
+            self.title_counts.update(path)
+            self.length_counts[len(path)] += 1
+            self.transition_counts.update(zip(path, path[1:]))
+        self.n_rows += len(df)
+        self._hashes = np.concatenate([self._hashes, hashes])
+        return self
+
+    def sync(self, df):
+        """df가 지금까지 센 행 뒤에 행을 추가한 데이터면 새 행만 누적하고, 아니면 처음부터 다시 셈
+
+        앞쪽 n_rows개 행의 해시가 이미 센 행들과 모두 같을 때만 추가로 봅니다
+        (행이 줄었거나 기존 행이 수정/교체된 경우는 다시 셈).
+        """
+        hashes = _row_hashes(df)
+        with self._lock:
+            if len(df) < self.n_rows or not np.array_equal(hashes[:self.n_rows], self._hashes):
+                self._reset()
+            self._count(df.iloc[self.n_rows:], hashes[self.n_rows:])
+        return self
+
+    def top_titles(self, n=10):
+        """빈도순 상위 n개 (직무, 건수)"""
+        return self.title_counts.most_common(n)
+
+    def top_transitions(self, n=10):
+        """빈도순 상위 n개 ((이전 직무, 다음 직무), 건수)"""
+        return self.transition_counts.most_common(n)
+
+    def length_histogram(self):
+        """경로 길이(직무 수) → 인원수, 길이 오름차순"""
+        return dict(sorted(self.length_counts.items()))
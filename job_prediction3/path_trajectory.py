@@ -0,0 +1,92 @@
+"""빔 서치로 여러 단계 앞의 직무 경로를 전망.
+
+다음 직무 확률은 PathPredictionTable(전체 경로 prefix 기준, 없으면 마지막 직무 기준)에서 가져오고,
+한 번 확장한 경로의 후보는 저장해 두어 여러 직원을 한꺼번에 전망할 때 공통 prefix를 다시 계산하지 않습니다.
+빔 서치와 확장 캐시는 직무 코드 튜플로만 다루고, 직무명은 project()의 결과에서만 변환합니다.
+"""
+import heapq
+import threading
+from collections import OrderedDict, namedtuple
+
+# 전망 결과 한 건 - path는 현재 경로 이후에 이어질 직무들, probability는 누적 확률
+Trajectory = namedtuple('Trajectory', ['path', 'probability'])
+
+# 확장 결과를 저장해 둘 최대 prefix 수 - 서버 전체에서 공유하므로 넘으면 가장 오래 안 쓴 것부터 제거
+DEFAULT_MAX_EXPANSIONS = 100_000
+
+
+class TrajectoryProjector:
+    """PathPredictionTable 위의 빔 서치 경로 전망기"""
+
+    def __init__(self, prediction_table, branching=5, max_expansions=DEFAULT_MAX_EXPANSIONS):
+        self.table = prediction_table
+        self.branching = branching
+        self.max_expansions = max_expansions
+        # 여러 세션의 스레드가 함께 쓰므로 LRU 갱신과 통계는 잠금 안에서 처리
+        self._expansions = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _expand(self, path):
+        """코드 경로 뒤에 올 (직무 코드, 조건부 확률) 후보 - 이미 거친 직무는 제외"""
+        with self._lock:
+            expansions = self._expansions.get(path)
+            if expansions is not None:
+                self._expansions.move_to_end(path)
+                self.hits += 1
+                return expansions
+            self.misses += 1
+
+        candidates, _ = self.table.predict_codes(path, self.branching + len(path))
+        visited = set(path)
+        expansions = tuple((code, confidence) for code, confidence, *_ in candidates if code not in visited)
+        expansions = expansions[:self.branching]
+        with self._lock:
+            self._expansions[path] = expansions
+            self._expansions.move_to_end(path)
+            while len(self._expansions) > self.max_expansions:
+                self._expansions.popitem(last=False)
+        return expansions
+
+    def project_codes(self, current_codes, steps=3, beam_width=5, k=3):
+        """현재 코드 경로 이후 최대 steps 단계의 상위 k개 Trajectory(path는 코드 튜플)를 누적 확률순으로 반환
+
+        더 이상 이어질 직무가 없는 경로는 그 시점에서 끝난 것으로 보고 후보에 남겨 둡니다.
+        """
+        current_path = tuple(current_codes)
+        if not current_path:
+            return []
+
+        beams = [((), 1.0)]
+        finished = []
+        for _ in range(steps):
+            candidates = []
+            for suffix, probability in beams:
+                expansions = self._expand(current_path + suffix)
+                if not expansions:
+                    finished.append((suffix, probability))
+                    continue
+                for code, p in expansions:
+                    candidates.append((suffix + (code,), probability * p))
+            beams = heapq.nlargest(beam_width, candidates, key=lambda c: c[1])
+            if not beams:
+                break
+        finished.extend(beams)
+
+        ranked = sorted((c for c in finished if c[0]), key=lambda c: (-c[1], c[0]))[:k]
+        return [Trajectory(suffix, probability) for suffix, probability in ranked]
+
+    def project(self, current_path, steps=3, beam_width=5, k=3):
+        """직무명 경로에 대한 project_codes - Trajectory의 path도 직무명 튜플"""
+        trajectories = self.project_codes(self.table.encode(current_path), steps, beam_width, k)
+        return [Trajectory(self.table.decode(t.path), t.probability) for t in trajectories]
+
+    def project_many(self, paths, steps=3, beam_width=5, k=3):
+        """배치 전망 - 경로 리스트와 같은 순서의 Trajectory 리스트들을 반환 (확장 결과는 공유)"""
+        return [self.project(path, steps, beam_width, k) for path in paths]
+
+    def cache_info(self):
+        """(적중, 미스, 저장된 prefix 수)"""
+        with self._lock:
+            return self.hits, self.misses, len(self._expansions)
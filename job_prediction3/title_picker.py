@@ -0,0 +1,63 @@
+"""직무 코드 기반 검색형 직무 선택 위젯.
+
+선택 상자의 옵션은 직무 코드(직무명 목록에서의 위치)이고 직무명은 표시할 때만 format_func로 변환합니다.
+직무가 많으면 검색어로 좁힌 최대 MAX_OPTIONS개만 옵션으로 보내므로 rerun마다 전체 목록을 보내지 않습니다.
+"""
+from functools import lru_cache
+
+import streamlit as st
+
+# 선택 상자에 한 번에 보낼 최대 옵션 수 - 이보다 직무가 많으면 검색창을 함께 표시
+MAX_OPTIONS = 200
+
+
+class TitleSearch:
+    """직무명 목록 위의 대소문자 무시 부분 문자열 검색 - 결과는 직무 코드 리스트
+
+    codes를 주면 그 직무 코드들만 검색/선택 대상으로 삼고, 코드는 그대로 전체 직무명 목록 기준입니다.
+    """
+
+    def __init__(self, titles, codes=None):
+        self.titles = list(titles)
+        self.codes = range(len(self.titles)) if codes is None else list(codes)
+        self._code_set = frozenset(self.codes)
+        self._folded = [(code, self.titles[code].casefold()) for code in self.codes]
+        # 같은 검색어는 여러 세션/rerun에서 다시 계산하지 않음
+        self.search = lru_cache(maxsize=1024)(self._search)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, code):
+        return code in self._code_set
+
+    def _search(self, query, limit=MAX_OPTIONS):
+        query = query.strip().casefold()
+        codes = []
+        for code, title in self._folded:
+            if query in title:
+                codes.append(code)
+                if len(codes) == limit:
+                    break
+        return tuple(codes)
+
+
+def title_selectbox(label, search, key, placeholder='선택하세요'):
+    """직무 코드를 반환하는 선택 상자 (선택하지 않으면 None)
+
+    코드는 데이터셋마다 가리키는 직무가 다르므로 key에는 데이터셋 식별자를 포함해야 합니다.
+    """
+    # 선택 대상이 바뀌어 더 이상 고를 수 없는 직무는 선택 해제
+    selected = st.session_state.get(key)
+    if selected is not None and selected not in search:
+        st.session_state[key] = selected = None
+    if len(search) <= MAX_OPTIONS:
+        options = search.codes
+    else:
+        query = st.text_input(f'{label} 검색', key=f'{key}_query', placeholder='직무명 일부를 입력하세요')
+        options = list(search.search(query))
+        # 검색어가 바뀌어도 이미 고른 직무는 유지
+        if selected is not None and selected not in options:
+            options.insert(0, selected)
+    return st.selectbox(label, options, index=None, format_func=search.titles.__getitem__,
+                        placeholder=placeholder, key=key)